@@ -5,7 +5,12 @@ from typing import Union
 StringDict = Dict[str, str]
 StringList = List[str]
 
+from .schema import Field
+from .schema import Schema
+from .schema import register_primitive
+
 from .settings import Settings
+from .settings import fingerprint
 
 from .dictionary_setting import DictionarySetting
 
@@ -13,12 +18,20 @@ from .list_setting import ListSetting
 
 from .terminus_setting import TerminusSetting
 
+from .range import Range
+from .range import Zipped
+
 from .number_setting import NumberSetting
 
 from .stringset_setting import StringSetSetting
 
 from .space import Space
 
+from .streaming import iter_array
+from .streaming import iter_object
+
+from .watcher import SettingsWatcher
+
 from .error import SettingRangeKeyError
 from .error import SettingRangeTypeError
 from .error import SettingStringSelectionError
@@ -26,6 +39,7 @@ from .error import SettingNotFoundError
 from .error import SettingCheckError
 from .error import SettingTypeError
 from .error import SettingErrorMessage
+from .error import SettingErrorCollector
 from .error import OptionsAttributeNotImplementedError
 from .error import OptionsAttributeTypeError
 from .error import TypeAttributeNotImplementedError
@@ -73,30 +73,174 @@ class DictionarySetting(js.Settings):
         if not isinstance(values, dict):
             raise js.SettingTypeError(dict, type(values))
 
-        self.value = dict()
-
-        if self.type not in self.primitive:
+        self.value = dict(values)
+        collector = js.SettingErrorCollector.current()
+        if collector is None:
             for key, value in values.items():
-                try:
-                    self.value[key] = self.type(value)
-                except js.SettingErrorMessage as e:
-                    raise js.SettingErrorMessage(key, e)
-                except js.SettingRangeTypeError as e:
-                    raise js.SettingErrorMessage(key, original_error=e)
-                except js.SettingRangeKeyError as e:
-                    raise js.SettingErrorMessage(key, original_error=e)
-                except js.SettingStringSelectionError as e:
-                    raise js.SettingErrorMessage(key, original_error=e)
-                except js.ConsistencyError as e:
-                    raise js.SettingErrorMessage(key, original_error=e)
+                self.assign_value(key, value)
         else:
             for key, value in values.items():
-                try:
-                    if not isinstance(value, self.type):
-                        raise js.SettingTypeError(self.type, type(value))
-                    self.value[key] = value
-                except js.SettingTypeError as e:
-                    raise js.SettingErrorMessage(key, original_error=e)
+                collector.run(key, self.assign_value, key, value)
+
+    def assign_value(self, key: str, value):
+        """Checks a single value against :attr:`type` and assigns it to
+        :attr:`value` at `key`.
+
+        Parameters
+        ----------
+        key : :obj:`str`
+            The key of the value.
+
+        value : :obj:`Any`
+            The value to be checked.
+
+        Raises
+        ------
+        :class:`~.SettingsErrorMessage`
+            If the value is not of the required type, or any exceptions are
+            raised when instantiating the subsetting.
+
+        """
+        self.value[key] = self.convert(key, value)
+
+    def convert(self, key: str, value):
+        """Checks a single value against :attr:`type` and returns the value to
+        be stored for it.
+
+        Parameters
+        ----------
+        key : :obj:`str`
+            The key of the value, used in error messages.
+
+        value : :obj:`Any`
+            The value to be checked.
+
+        Returns
+        -------
+        :obj:`Any`
+            The subsetting instantiated from `value`, or `value` itself if
+            :attr:`type` is primitive.
+
+        Raises
+        ------
+        :class:`~.SettingsErrorMessage`
+            If the value is not of the required type, or any exceptions are
+            raised when instantiating the subsetting.
+
+        """
+        field = self.__schema__.fields["type"]
+        if not field.primitive:
+            try:
+                rv = self.type(value)
+            except js.SettingErrorMessage as e:
+                raise e.prepend(key)
+            except js.SettingRangeTypeError as e:
+                raise js.SettingErrorMessage(key, original_error=e)
+            except js.SettingRangeKeyError as e:
+                raise js.SettingErrorMessage(key, original_error=e)
+            except js.SettingStringSelectionError as e:
+                raise js.SettingErrorMessage(key, original_error=e)
+            except js.ConsistencyError as e:
+                raise js.SettingErrorMessage(key, original_error=e)
+            if field.compact:
+                del rv.__source__
+            return rv
+        else:
+            try:
+                if not isinstance(value, self.type):
+                    raise js.SettingTypeError(self.type, type(value))
+                return value
+            except js.SettingTypeError as e:
+                raise js.SettingErrorMessage(key, original_error=e)
+
+    @classmethod
+    def stream(cls, file, chunk_size: int = 65536):
+        """A generator that validates the values of a JSON object file one at
+        a time, without loading the whole object into memory.
+
+        The file is tokenized incrementally, so only about one value is held
+        in memory at a time. The consistency check of the class itself is not
+        run, as the whole dictionary is never built.
+
+        Parameters
+        ----------
+        file : :obj:`Union`[:obj:`str`, :obj:`IO`]
+            The path of the JSON file, or a text stream.
+
+        chunk_size : :obj:`int`
+            The number of characters read at a time.
+
+        Yields
+        ------
+        :obj:`tuple`[:obj:`str`, :obj:`Any`]
+            The keys and checked values, as they would be stored in
+            :attr:`value`.
+
+        Raises
+        ------
+        :class:`~.SettingTypeError`
+            If the file does not contain a JSON object.
+
+        :class:`~.SettingsErrorMessage`
+            If any value fails its checks. The route starts with its key.
+
+        """
+        setting = object.__new__(cls)
+        setting.prepare(cls.__init__.__wrapped__, dict())
+        if not hasattr(setting, "type"):
+            raise js.TypeAttributeNotImplementedError(cls)
+        if not isinstance(setting.type, type):
+            raise js.TypeAttributeTypeError(cls)
+        if isinstance(file, str):
+            with open(file, 'r') as f:
+                yield from cls.stream(f, chunk_size)
+            return
+        for key, value in js.streaming.iter_object(file, chunk_size):
+            yield key, setting.convert(key, value)
+
+    def validate_all(self):
+        """Checks and assigns every pending attribute of the lazy settings
+        instances stored in :attr:`value`.
+
+        Returns
+        -------
+        :class:`~.Settings`
+            The instance itself.
+
+        """
+        for item in self.value.values():
+            if isinstance(item, js.Settings):
+                item.validate_all()
+        return self
+
+    def node(self, key: str):
+        """Returns the setting instance stored at a key.
+
+        """
+        return self.value[key]
+
+    def attach(self, key: str, node):
+        """Assigns an already validated setting instance to a key.
+
+        """
+        self.value[key] = node
+
+    def _source(self) -> dict:
+        """The values the instance was built from, rebuilt from
+        :attr:`value`.
+
+        """
+        return {
+            key: value._source()
+            if isinstance(value, (js.Settings, js.TerminusSetting)) else value
+            for key, value in self.value.items()
+        }
+
+    def __copy__(self):
+        rv = object.__new__(type(self))
+        rv.__dict__.update(self.__dict__)
+        rv.value = dict(self.value)
+        return rv
 
     def __getitem__(self, key):
         """An overload of the :obj:`dict` __getitem__ method.
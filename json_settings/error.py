@@ -1,13 +1,26 @@
+import threading
+
 from typing import Union
 
 import json_settings as js
 
 
+def rebuild(cls, state: dict):
+    """Recreates an :class:`Error` from its class and attributes, when it is
+    unpickled.
+
+    """
+    rv = cls.__new__(cls)
+    rv.__dict__.update(state)
+    return rv
+
+
 class Error(Exception):
     """The base class fro mwhich all other Error classes inherit
 
     """
-    pass
+    def __reduce__(self):
+        return rebuild, (type(self), self.__dict__)
 
 
 class SettingRangeKeyError(Error):
@@ -100,6 +113,11 @@ class SettingErrorMessage(Error):
     """The exception raised when the setting found in the passed :obj:`dict`
     is of the wrong type.
 
+    The message is only built when the exception is displayed, or its
+    :attr:`args` are read. As the exception propagates up through nested
+    settings, each level adds its name to the route with :meth:`prepend` and
+    raises the same instance.
+
     """
     def __init__(
             self,
@@ -117,17 +135,44 @@ class SettingErrorMessage(Error):
             The expected type of the setting.
         """
         if original_error:
-            self.route = [current_name]
+            self._route = [current_name]
             self.original_error = original_error
 
         elif branch_error:
-            self.route = [current_name] + branch_error.route
+            self._route = branch_error._route + [current_name]
             self.original_error = branch_error.original_error
         else:
             raise ValueError(
                 "Must pass either new error or branch error as parameter.")
 
-        super().__init__(self.build_message())
+        super().__init__()
+
+    @property
+    def route(self) -> js.StringList:
+        """:obj:`List`[:obj:`str`] : The names of the settings from the
+        outermost to the one that failed.
+
+        """
+        return self._route[::-1]
+
+    @property
+    def args(self) -> tuple:
+        """:obj:`tuple`[:obj:`str`] : The message, for the current route.
+
+        """
+        return (self.build_message(),)
+
+    def prepend(self, name: str):
+        """Adds the name of an enclosing setting to the start of the route.
+
+        Returns
+        -------
+        :class:`SettingErrorMessage`
+            The exception itself, to be raised again.
+
+        """
+        self._route.append(name)
+        return self
 
     def build_message(self):
         rv = str()
@@ -139,6 +184,88 @@ class SettingErrorMessage(Error):
         rv += f"{str(self.original_error.msg)}"
         return rv
 
+    def __str__(self):
+        return self.build_message()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.build_message()!r})"
+
+
+class SettingErrorCollector:
+    """An accumulator for the errors found when validating settings in
+    collect-all-errors mode.
+
+    While a collector is active, as a context manager, the settings classes
+    record each failing setting in it and carry on, instead of raising. Its
+    :attr:`path` tracks the route to the setting being validated, so that
+    every error is recorded with its full route.
+
+    Attributes
+    ----------
+    path : :obj:`List`[:obj:`str`]
+        The names of the settings enclosing the one being validated.
+
+    errors : :obj:`List`[:class:`SettingErrorMessage`]
+        The errors recorded so far.
+
+    """
+    local = threading.local()
+
+    def __init__(self):
+        """The constructor for the :class:`SettingErrorCollector` class.
+
+        """
+        self.path = list()
+        self.errors = list()
+        self.previous = None
+
+    @classmethod
+    def current(cls):
+        """Returns the active collector of the current thread, or None.
+
+        """
+        return getattr(cls.local, "collector", None)
+
+    def add(self, error: SettingErrorMessage):
+        """Records an error, adding :attr:`path` to the start of its route.
+
+        """
+        error._route.extend(reversed(self.path))
+        self.errors.append(error)
+
+    def run(self, name: str, method, *args):
+        """Calls `method` to validate the setting `name`, recording any error
+        it raises.
+
+        Returns
+        -------
+        :obj:`bool`
+            True if `method` did not raise an error.
+
+        """
+        self.path.append(name)
+        try:
+            method(*args)
+        except SettingErrorMessage as e:
+            self.path.pop()
+            self.add(e)
+            return False
+        except Error as e:
+            error = SettingErrorMessage(name, original_error=e)
+            self.path.pop()
+            self.add(error)
+            return False
+        self.path.pop()
+        return True
+
+    def __enter__(self):
+        self.previous = self.current()
+        self.local.collector = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.local.collector = self.previous
+
 
 class OptionsAttributeNotImplementedError(Error):
     """The exception raised when the `options` attribute has not been defined
@@ -1,8 +1,17 @@
 from collections.abc import Iterable
 
+from numpy import array
+from numpy import bool_
+from numpy import float64
+from numpy import int64
+from numpy import ndarray
+
 import json_settings as js
 
 
+DTYPES = {int: int64, float: float64, bool: bool_}
+
+
 class ListSetting(js.Settings):
 
     """A base class for a list of settings classes.
@@ -24,12 +33,30 @@ class ListSetting(js.Settings):
         The attribute defined in the child class that determines the type of
         the setting stored in the class.
 
-    value : :obj:`List`[:obj:`Any`]
+    value : :obj:`Union`[:obj:`List`[:obj:`Any`], :obj:`numpy.ndarray`]
         The list of value stored after all checks have been passed.
 
+    packed : :obj:`bool`
+        A class attribute. If True and :attr:`type` is :obj:`int`,
+        :obj:`float` or :obj:`bool`, :attr:`value` is stored as a
+        :obj:`numpy.ndarray` of the matching dtype, whose items are checked
+        in bulk. Lists containing items of a derived type, e.g. :obj:`bool`
+        items in a list of :obj:`int`, or integers too large for the dtype,
+        are stored as a :obj:`list`.
+
     """
+    packed = False
+
     @property
     def get(self):
+        """:obj:`Union`[:obj:`list`, :obj:`numpy.ndarray`] : :attr:`value`,
+        or a read only view of it if it is packed.
+
+        """
+        if isinstance(self.value, ndarray):
+            rv = self.value.view()
+            rv.flags.writeable = False
+            return rv
         return self.value
 
     def distribute(self, values: list):
@@ -75,30 +102,188 @@ class ListSetting(js.Settings):
         if not isinstance(values, list):
             raise js.SettingTypeError(list, type(values))
 
-        self.value = list()
+        if self.packed and self.type in DTYPES and \
+                set(map(type, values)) <= {self.type}:
+            try:
+                self.value = array(values, dtype=DTYPES[self.type])
+                return
+            except OverflowError:
+                pass
 
-        if self.type not in self.primitive:
+        self.value = list(values)
+        collector = js.SettingErrorCollector.current()
+        if collector is None:
             for idx, item in enumerate(values):
-                try:
-                    self.value.append(self.type(item))
-                except js.SettingErrorMessage as e:
-                    raise js.SettingErrorMessage(f"[{idx}]", e)
-                except js.SettingTypeError as e:
-                    raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
-                except js.SettingRangeTypeError as e:
-                    raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
-                except js.SettingRangeKeyError as e:
-                    raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
-                except js.ConsistencyError as e:
-                    raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+                self.assign_value(idx, item)
         else:
             for idx, item in enumerate(values):
-                try:
-                    if not isinstance(item, self.type):
-                        raise js.SettingTypeError(self.type, type(item))
-                    self.value.append(item)
-                except js.SettingStringSelectionError as e:
-                    raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+                collector.run(f"[{idx}]", self.assign_value, idx, item)
+
+    def assign_value(self, idx: int, item):
+        """Checks a single item against :attr:`type` and assigns it to
+        :attr:`value` at index `idx`.
+
+        Parameters
+        ----------
+        idx : :obj:`int`
+            The index of the item.
+
+        item : :obj:`Any`
+            The item to be checked.
+
+        Raises
+        ------
+        :class:`~.SettingsErrorMessage`
+            If any exceptions are raised when instantiating the subsetting.
+
+        """
+        self.value[idx] = self.convert(idx, item)
+
+    def convert(self, idx: int, item):
+        """Checks a single item against :attr:`type` and returns the value to
+        be stored for it.
+
+        Parameters
+        ----------
+        idx : :obj:`int`
+            The index of the item, used in error messages.
+
+        item : :obj:`Any`
+            The item to be checked.
+
+        Returns
+        -------
+        :obj:`Any`
+            The subsetting instantiated from `item`, or `item` itself if
+            :attr:`type` is primitive.
+
+        Raises
+        ------
+        :class:`~.SettingsErrorMessage`
+            If any exceptions are raised when instantiating the subsetting.
+
+        """
+        field = self.__schema__.fields["type"]
+        if not field.primitive:
+            try:
+                rv = self.type(item)
+            except js.SettingErrorMessage as e:
+                raise e.prepend(f"[{idx}]")
+            except js.SettingTypeError as e:
+                raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+            except js.SettingRangeTypeError as e:
+                raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+            except js.SettingRangeKeyError as e:
+                raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+            except js.ConsistencyError as e:
+                raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+            if field.compact:
+                del rv.__source__
+            return rv
+        else:
+            try:
+                if not isinstance(item, self.type):
+                    raise js.SettingTypeError(self.type, type(item))
+                return item
+            except js.SettingStringSelectionError as e:
+                raise js.SettingErrorMessage(f"[{idx}]", original_error=e)
+
+    @classmethod
+    def stream(cls, file, chunk_size: int = 65536):
+        """A generator that validates the items of a JSON array file one at a
+        time, without loading the whole array into memory.
+
+        The file is tokenized incrementally, so only about one item is held
+        in memory at a time. The consistency check of the class itself is not
+        run, as the whole list is never built.
+
+        Parameters
+        ----------
+        file : :obj:`Union`[:obj:`str`, :obj:`IO`]
+            The path of the JSON file, or a text stream.
+
+        chunk_size : :obj:`int`
+            The number of characters read at a time.
+
+        Yields
+        ------
+        :obj:`Any`
+            The checked items, as they would be stored in :attr:`value`.
+
+        Raises
+        ------
+        :class:`~.SettingTypeError`
+            If the file does not contain a JSON array.
+
+        :class:`~.SettingsErrorMessage`
+            If any item fails its checks. The route starts with the index of
+            the item, e.g. `[idx] -> field`.
+
+        """
+        setting = object.__new__(cls)
+        setting.prepare(cls.__init__.__wrapped__, list())
+        if not hasattr(setting, "type"):
+            raise js.TypeAttributeNotImplementedError(cls)
+        if not isinstance(setting.type, type):
+            raise js.TypeAttributeTypeError(cls)
+        if isinstance(file, str):
+            with open(file, 'r') as f:
+                yield from cls.stream(f, chunk_size)
+            return
+        for idx, item in enumerate(js.streaming.iter_array(file,
+                                                           chunk_size)):
+            yield setting.convert(idx, item)
+
+    def validate_all(self):
+        """Checks and assigns every pending attribute of the lazy settings
+        instances stored in :attr:`value`.
+
+        Returns
+        -------
+        :class:`~.Settings`
+            The instance itself.
+
+        """
+        if self.__schema__.fields["type"].primitive:
+            return self
+        for item in self.value:
+            if isinstance(item, js.Settings):
+                item.validate_all()
+        return self
+
+    def node(self, idx: int):
+        """Returns the setting instance stored at an index.
+
+        """
+        return self.value[idx]
+
+    def attach(self, idx: int, node):
+        """Assigns an already validated setting instance to an index.
+
+        """
+        self.value[idx] = node
+
+    def _source(self) -> list:
+        """The values the instance was built from, rebuilt from
+        :attr:`value`.
+
+        """
+        if isinstance(self.value, ndarray):
+            return self.value.tolist()
+        return [
+            item._source()
+            if isinstance(item, (js.Settings, js.TerminusSetting)) else item
+            for item in self.value
+        ]
+
+    def __copy__(self):
+        rv = object.__new__(type(self))
+        rv.__dict__.update(self.__dict__)
+        if isinstance(self.value, ndarray):
+            rv.value = self.value.copy()
+        else:
+            rv.value = list(self.value)
+        return rv
 
     def __getitem__(self, key):
         """An overload of the list get item method.
@@ -110,6 +295,8 @@ class ListSetting(js.Settings):
 
         """
         rv = self.value[key]
+        if isinstance(self.value, ndarray):
+            return rv.item() if rv.ndim == 0 else self.get[key]
         if issubclass(self.type, js.TerminusSetting):
             if isinstance(rv, Iterable):
                 return [item.get for item in rv]
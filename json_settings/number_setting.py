@@ -1,4 +1,5 @@
-from numpy import linspace
+from numpy import asarray
+from numpy import isfinite
 
 import json_settings as js
 
@@ -11,8 +12,9 @@ class NumberSetting(js.TerminusSetting):
 
     Attributes
     ----------
-    value : :obj:`Union`[:obj:`float`, :obj:`int`, :obj:`List`]
-        The value or list of values stored.
+    value : :obj:`Union`[:obj:`float`, :obj:`int`, :obj:`Sequence`]
+        The value or list of values stored. A range defined by min/max/num is
+        stored as a :class:`~.Range`, whose values are computed on access.
 
     """
 
@@ -23,6 +25,31 @@ class NumberSetting(js.TerminusSetting):
         """
         return self._range
 
+    def _source(self):
+        """The value the instance was built from, a number or the
+        :obj:`dict` defining a range.
+
+        """
+        return self._definition if self._range else self.value
+
+    @property
+    def array(self):
+        """:obj:`numpy.ndarray` : The values of an array as an array.
+
+        The array is built once, and rebuilt only if :attr:`value` is
+        replaced.
+
+        """
+        try:
+            value, rv = self._array
+            if value is self.value:
+                return rv
+        except AttributeError:
+            pass
+        rv = asarray(self.value)
+        self._array = (self.value, rv)
+        return rv
+
     @property
     def match(self):
         """:obj:`Union`[None, :obj:`str`] : The match parameter.
@@ -96,10 +123,13 @@ class NumberSetting(js.TerminusSetting):
             If the values in the array are not the same type as :attr:`type`
 
         """
-        for item in value["array"]:
-            if not isinstance(item, self.type):
-                raise js.SettingTypeError(self.type, type(item))
+        for item_type in set(map(type, value["array"])):
+            if not issubclass(item_type, self.type):
+                for item in value["array"]:
+                    if not isinstance(item, self.type):
+                        raise js.SettingTypeError(self.type, type(item))
         self.value = value["array"]
+        self._definition = value
         self._range = True
         try:
             self._match = value["match"]
@@ -158,14 +188,48 @@ class NumberSetting(js.TerminusSetting):
                 raise js.SettingRangeTypeError('num', int)
         except KeyError:
             raise js.SettingRangeKeyError("num")
-        self.value = linspace(value['min'], value['max'], abs(value['num']))
-        self.value = [self.type(item) for item in self.value]
+        self.value = js.Range(value['min'],
+                              value['max'],
+                              abs(value['num']),
+                              self.type)
+        self._definition = value
         self._range = True
         try:
             self._match = value["match"]
         except KeyError:
             self._match = None
 
+    def __fail(self, failed, message: str):
+        """Raises a :obj:`ValueError` if any values of a range or array fail a
+        check.
+
+        Parameters
+        ----------
+        failed : :obj:`Callable`
+            Returns True for a value that fails the check. For an array, it is
+            applied to :attr:`array` as a whole and must return a boolean
+            array. For a :class:`~.Range`, it is applied to single values, and
+            only to the ends of the range and a bisection between them.
+
+        message : :obj:`str`
+            The error message, to which the first failing value and its index
+            are added.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If any values fail the check.
+
+        """
+        if isinstance(self.value, js.Range):
+            idx = self.value.first(failed)
+        else:
+            mask = failed(self.array)
+            idx = int(mask.argmax()) if mask.any() else None
+        if idx is not None:
+            raise ValueError(f"{message}, found {self.value[idx]} at index "
+                             f"{idx}")
+
     def lower_bound(self, value):
         """Checks if values are above or equal to a lower bound.
 
@@ -179,21 +243,13 @@ class NumberSetting(js.TerminusSetting):
         Raises
         ------
         :obj:`ValueError`
-            If any values are less than or equal to the provided bound.
+            If any values are less than the provided bound.
 
         """
-        if isinstance(self.value, self.type):
-            if self.value < value:
-                raise ValueError(f"must be >= {value}")
-        elif isinstance(self.value, list):
-            for item in self.value:
-                if item < value:
-                    raise ValueError(f"must be >= {value}")
-        elif isinstance(self.value, dict):
-            if self.value["min"] < value:
-                raise ValueError(f"must be >= {value}")
-            if self.value["max"] < value:
-                raise ValueError(f"must be >= {value}")
+        if self._range:
+            self.__fail(lambda item: item < value, f"must be >= {value}")
+        elif self.value < value:
+            raise ValueError(f"must be >= {value}")
 
     def upper_bound(self, value):
         """Checks if values are below or equal to an upper bound.
@@ -208,24 +264,16 @@ class NumberSetting(js.TerminusSetting):
         Raises
         ------
         :obj:`ValueError`
-            If any values are greater than or equal to the provided bound.
+            If any values are greater than the provided bound.
 
         """
-        if isinstance(self.value, self.type):
-            if self.value > value:
-                raise ValueError(f"must be <= {value}")
-        elif isinstance(self.value, list):
-            for item in self.value:
-                if item > value:
-                    raise ValueError(f"must be <= {value}")
-        elif isinstance(self.value, dict):
-            if self.value["min"] > value:
-                raise ValueError(f"must be <= {value}")
-            if self.value["max"] > value:
-                raise ValueError(f"must be <= {value}")
+        if self._range:
+            self.__fail(lambda item: item > value, f"must be <= {value}")
+        elif self.value > value:
+            raise ValueError(f"must be <= {value}")
 
     def lower_bound_exclusive(self, value):
-        """Checks if values are above an upper bound.
+        """Checks if values are above a lower bound.
 
         Helper function to be called in derived class check implementation.
 
@@ -237,47 +285,90 @@ class NumberSetting(js.TerminusSetting):
         Raises
         ------
         :obj:`ValueError`
-            If any values are greater than the provided bound.
+            If any values are less than or equal to the provided bound.
 
         """
-        if isinstance(self.value, self.type):
-            if self.value <= value:
-                raise ValueError(f"must be > {value}")
-        elif isinstance(self.value, list):
-            for item in self.value:
-                if item <= value:
-                    raise ValueError(f"must be > {value}")
-        elif isinstance(self.value, dict):
-            if self.value["min"] <= value:
-                raise ValueError(f"must be > {value}")
-            if self.value["max"] <= value:
-                raise ValueError(f"must be > {value}")
+        if self._range:
+            self.__fail(lambda item: item <= value, f"must be > {value}")
+        elif self.value <= value:
+            raise ValueError(f"must be > {value}")
 
     def upper_bound_exclusive(self, value):
-        """Checks if values are above an lower bound.
+        """Checks if values are below an upper bound.
 
         Helper function to be called in derived class check implementation.
 
         Parameters
         ----------
         value : :obj:`Union`[:obj:`float`, :obj:`int`]
+            The upper bound.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If any values are greater than or equal to the provided bound.
+
+        """
+        if self._range:
+            self.__fail(lambda item: item >= value, f"must be < {value}")
+        elif self.value >= value:
+            raise ValueError(f"must be < {value}")
+
+    def in_interval(self,
+                    lower,
+                    upper,
+                    lower_inclusive: bool = True,
+                    upper_inclusive: bool = True):
+        """Checks if values are within an interval.
+
+        Helper function to be called in derived class check implementation.
+
+        Parameters
+        ----------
+        lower : :obj:`Union`[:obj:`float`, :obj:`int`]
             The lower bound.
 
+        upper : :obj:`Union`[:obj:`float`, :obj:`int`]
+            The upper bound.
+
+        lower_inclusive : :obj:`bool`
+            If True, values equal to `lower` are within the interval.
+
+        upper_inclusive : :obj:`bool`
+            If True, values equal to `upper` are within the interval.
+
         Raises
         ------
         :obj:`ValueError`
-            If any values are greater than the provided bound.
+            If any values are outside the interval.
+
+        """
+        def failed(item):
+            below = item < lower if lower_inclusive else item <= lower
+            above = item > upper if upper_inclusive else item >= upper
+            return below | above
+
+        message = f"must be in {'[' if lower_inclusive else '('}{lower}, " \
+            f"{upper}{']' if upper_inclusive else ')'}"
+        if self._range:
+            self.__fail(failed, message)
+        elif failed(self.value):
+            raise ValueError(message)
+
+    def finite(self):
+        """Checks if values are neither infinite nor NaN.
+
+        Helper function to be called in derived class check implementation.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If any values are infinite or NaN.
 
         """
-        if isinstance(self.value, self.type):
-            if self.value >= value:
-                raise ValueError(f"must be < {value}")
-        elif isinstance(self.value, list):
-            for item in self.value:
-                if item >= value:
-                    raise ValueError(f"must be < {value}")
-        elif isinstance(self.value, dict):
-            if self.value["min"] >= value:
-                raise ValueError(f"must be < {value}")
-            if self.value["max"] >= value:
-                raise ValueError(f"must be < {value}")
+        if issubclass(self.type, int):
+            return
+        if self._range:
+            self.__fail(lambda item: ~isfinite(item), "must be finite")
+        elif not isfinite(self.value):
+            raise ValueError("must be finite")
@@ -0,0 +1,296 @@
+from collections.abc import Sequence
+
+from numpy import arange
+from numpy import asarray
+from numpy import column_stack
+
+
+class Range(Sequence):
+    """The evenly spaced values of a :class:`~.NumberSetting` range, computed
+    on access rather than stored.
+
+    The values are those of :obj:`numpy.linspace` over the closed interval
+    from :attr:`min` to :attr:`max`, each converted to :attr:`type`, at the
+    positions in :attr:`indices`, but only the definition of the range is
+    kept in memory. Slicing a range gives another range.
+
+    Attributes
+    ----------
+    min : :obj:`Union`[:obj:`float`, :obj:`int`]
+        The first value.
+
+    max : :obj:`Union`[:obj:`float`, :obj:`int`]
+        The last value.
+
+    num : :obj:`int`
+        The number of values.
+
+    type : :obj:`type`
+        The type the values are converted to.
+
+    indices : :obj:`range`
+        The positions, among the `num` values, of the values of the range.
+
+    """
+    __slots__ = ("min", "max", "num", "type", "indices")
+
+    def __init__(self,
+                 minimum,
+                 maximum,
+                 num: int,
+                 value_type: type,
+                 indices: range = None):
+        """The constructor for the :class:`Range` class.
+
+        Parameters
+        ----------
+        minimum : :obj:`Union`[:obj:`float`, :obj:`int`]
+            The first value.
+
+        maximum : :obj:`Union`[:obj:`float`, :obj:`int`]
+            The last value.
+
+        num : :obj:`int`
+            The number of values.
+
+        value_type : :obj:`type`
+            The type the values are converted to.
+
+        indices : :obj:`range`
+            The positions, among the `num` values, of the values of the
+            range. By default all of them.
+
+        """
+        self.min = minimum
+        self.max = maximum
+        self.num = num
+        self.type = value_type
+        self.indices = range(num) if indices is None else indices
+
+    def value(self, position: int):
+        """Computes the value at a position among the `num` values, as
+        :obj:`numpy.linspace` would.
+
+        """
+        if position == self.num - 1 and self.num > 1:
+            return self.type(float(self.max))
+        start = float(self.min)
+        step = (float(self.max) - start) / max(self.num - 1, 1)
+        return self.type(position * step + start)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, idx):
+        """Computes the value at an index, or the :class:`Range` of the
+        values of a slice.
+
+        """
+        if isinstance(idx, slice):
+            return Range(self.min, self.max, self.num, self.type,
+                         self.indices[idx])
+        return self.value(self.indices[idx])
+
+    def __iter__(self):
+        for position in self.indices:
+            yield self.value(position)
+
+    def __array__(self, dtype=None, copy=None):
+        positions = arange(self.indices.start,
+                           self.indices.stop,
+                           self.indices.step)
+        start = float(self.min)
+        step = (float(self.max) - start) / max(self.num - 1, 1)
+        rv = positions * step + start
+        if self.num > 1:
+            rv[positions == self.num - 1] = float(self.max)
+        if self.type in (int, float):
+            rv = rv.astype(self.type)
+        else:
+            rv = asarray([self.type(item) for item in rv])
+        return rv if dtype is None else rv.astype(dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, Range):
+            return (self.min, self.max, self.num, self.type,
+                    self.indices) == \
+                (other.min, other.max, other.num, other.type, other.indices)
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and \
+                all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        rv = f"Range({self.min!r}, {self.max!r}, {self.num!r}, " \
+             f"{self.type.__name__}"
+        if self.indices != range(self.num):
+            rv += f", {self.indices!r}"
+        return rv + ")"
+
+    def __contains__(self, value):
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
+
+    def index(self, value, start: int = 0, stop: int = None) -> int:
+        """The index of the first occurrence of a value.
+
+        As the values are monotonic, the index is found by bisection, without
+        computing every value.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If `value` is not in the range.
+
+        """
+        indices = range(len(self))[start:stop]
+        try:
+            descending = len(self) > 1 and self[-1] < self[0]
+            lower, upper = 0, len(indices)
+            while lower < upper:
+                middle = (lower + upper) // 2
+                item = self[indices[middle]]
+                if (value < item) if descending else (item < value):
+                    lower = middle + 1
+                else:
+                    upper = middle
+            found = lower < len(indices) and self[indices[lower]] == value
+        except TypeError:
+            found = False
+        if found:
+            return indices[lower]
+        raise ValueError(f"{value!r} is not in range")
+
+    def first(self, failed) -> int:
+        """The index of the first value that fails a check.
+
+        The values that pass the check must be a contiguous run of the range,
+        e.g. those within an interval, so that only the ends of the range and
+        a bisection are needed.
+
+        Parameters
+        ----------
+        failed : :obj:`Callable`
+            Returns True for a value that fails the check.
+
+        Returns
+        -------
+        :obj:`int`
+            The index, or None if every value passes.
+
+        """
+        if not len(self):
+            return None
+        if failed(self[0]):
+            return 0
+        if not failed(self[-1]):
+            return None
+        lower, upper = 0, len(self) - 1
+        while upper - lower > 1:
+            middle = (lower + upper) // 2
+            if failed(self[middle]):
+                upper = middle
+            else:
+                lower = middle
+        return upper
+
+
+class Zipped(Sequence):
+    """The tuples of the values of a number of sequences at each index, as
+    :obj:`zip` would give them, computed on access rather than stored.
+
+    It is used for the axes of a :class:`~.Space` along which ranges with the
+    same match id vary together, so that no :class:`Range` among them is
+    expanded.
+
+    Attributes
+    ----------
+    columns : :obj:`List`[:obj:`Sequence`]
+        The sequences, each cut to the length of the shortest.
+
+    """
+    __slots__ = ("columns",)
+
+    def __init__(self, columns):
+        """The constructor for the :class:`Zipped` class.
+
+        Parameters
+        ----------
+        columns : :obj:`Iterable`[:obj:`Sequence`]
+            The sequences to be zipped.
+
+        """
+        columns = list(columns)
+        size = min(map(len, columns)) if columns else 0
+        self.columns = [
+            column if len(column) == size else column[:size]
+            for column in columns
+        ]
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, idx):
+        """The tuple of the values at an index, or the :class:`Zipped` of the
+        values of a slice.
+
+        """
+        if isinstance(idx, slice):
+            return Zipped(column[idx] for column in self.columns)
+        idx = range(len(self))[idx]
+        return tuple(column[idx] for column in self.columns)
+
+    def __iter__(self):
+        return zip(*self.columns)
+
+    def __array__(self, dtype=None, copy=None):
+        rv = column_stack([asarray(column) for column in self.columns])
+        return rv if dtype is None else rv.astype(dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, Zipped):
+            return self.columns == other.columns
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and \
+                all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Zipped({self.columns!r})"
+
+    def index(self, value, start: int = 0, stop: int = None) -> int:
+        """The index of the first occurrence of a tuple of values.
+
+        The candidates are found with :meth:`Range.index` on the first
+        :class:`Range` column, so the values are not all computed.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If `value` is not in the sequence.
+
+        """
+        ranges = [(idx, column) for idx, column in enumerate(self.columns)
+                  if isinstance(column, Range)]
+        if not ranges:
+            return super().index(value, start, stop)
+        indices = range(len(self))[start:stop]
+        try:
+            value = tuple(value)
+        except TypeError:
+            value = None
+        if value is not None and len(value) == len(self.columns):
+            column, ranged = ranges[0]
+            lower = indices.start
+            while True:
+                try:
+                    idx = ranged.index(value[column], lower, indices.stop)
+                except ValueError:
+                    break
+                if self[idx] == value:
+                    return idx
+                lower = idx + 1
+        raise ValueError(f"{value!r} is not in zipped sequence")
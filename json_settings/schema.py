@@ -0,0 +1,143 @@
+import builtins
+
+import json_settings as js
+
+
+PRIMITIVE_TYPES = frozenset(
+    getattr(builtins, d) for d in dir(builtins)
+    if isinstance(getattr(builtins, d), type))
+
+
+def register_primitive(*types: type):
+    """Adds types to the registry of primitive (leaf) types.
+
+    Attributes whose expected type is in the registry are checked with
+    :obj:`isinstance` rather than being instantiated from the passed value,
+    e.g. `numpy.float64` or `decimal.Decimal`.
+
+    The registry is replaced rather than mutated and the compiled
+    :class:`Schema` of every :class:`~.Settings` derived class is discarded,
+    so they are recompiled against the new registry.
+
+    Parameters
+    ----------
+    *types : :obj:`type`
+        The types to be treated as primitive.
+
+    Raises
+    ------
+    :obj:`TypeError`
+        If any of `types` is not a :obj:`type`.
+
+    """
+    global PRIMITIVE_TYPES
+    for item in types:
+        if not isinstance(item, type):
+            raise TypeError(f"{item} is not a type")
+    PRIMITIVE_TYPES = PRIMITIVE_TYPES | frozenset(types)
+    stack = [js.Settings]
+    while stack:
+        cls = stack.pop()
+        if "__schema__" in cls.__dict__:
+            del cls.__schema__
+        stack.extend(cls.__subclasses__())
+
+
+class Field:
+    """A single attribute/type pair of a compiled :class:`Schema`.
+
+    Attributes
+    ----------
+    name : :obj:`str`
+        The name of the attribute in the derived class.
+
+    type : :obj:`type`
+        The expected type of the attribute, as defined in the derived class'
+        constructor.
+
+    primitive : :obj:`bool`
+        True if :attr:`type` is a built in type, False if it is a nested
+        :class:`~.Settings` or :class:`~.TerminusSetting` derived class.
+
+    unwrap : :obj:`bool`
+        True if instances of :attr:`type` are stored as the value of their
+        `get` attribute, i.e. :attr:`type` is derived from
+        :class:`~.TerminusSetting`, :class:`~.ListSetting` or
+        :class:`~.DictionarySetting`.
+
+    nested : :obj:`bool`
+        True if :attr:`type` is derived from :class:`~.Settings`, including
+        :class:`~.ListSetting` and :class:`~.DictionarySetting`.
+
+    terminus : :obj:`bool`
+        True if :attr:`type` is derived from :class:`~.TerminusSetting`.
+
+    compact : :obj:`bool`
+        True if :attr:`type` is derived from :class:`~.Settings`, but not
+        :class:`~.ListSetting` or :class:`~.DictionarySetting`, and its
+        `compact` class attribute is True.
+
+    """
+    __slots__ = ("name", "type", "primitive", "unwrap", "nested", "terminus",
+                 "compact")
+
+    def __init__(self, name: str, setting_type: type, primitive: bool):
+        """The constructor for the :class:`Field` class.
+
+        """
+        self.name = name
+        self.type = setting_type
+        self.primitive = primitive
+        self.unwrap = not primitive and isinstance(setting_type, type) and \
+            issubclass(setting_type, (js.TerminusSetting,
+                                      js.ListSetting,
+                                      js.DictionarySetting))
+        self.nested = not primitive and isinstance(setting_type, type) and \
+            issubclass(setting_type, js.Settings)
+        self.terminus = not primitive and isinstance(setting_type, type) and \
+            issubclass(setting_type, js.TerminusSetting)
+        self.compact = self.nested and not self.unwrap and \
+            setting_type.compact
+
+
+class Schema:
+    """The compiled attribute/type table of a :class:`~.Settings` derived
+    class.
+
+    The table is built by the decorator :meth:`Settings.assign` from the
+    first instance of a class and stored on the class, so that later
+    instances do not have to rediscover it.
+
+    Attributes
+    ----------
+    attributes : :obj:`dict`[:obj:`str`, :obj:`type`]
+        The attribute/type pairs defined in the derived class' constructor.
+
+    fields : :obj:`dict`[:obj:`str`, :class:`Field`]
+        The compiled :class:`Field` for each attribute, in definition order.
+
+    static : :obj:`bool`
+        True if every attribute is assigned a type, so that the constructor
+        body does not need to be run again for later instances.
+
+    """
+
+    def __init__(self, attributes: dict, primitive):
+        """The constructor for the :class:`Schema` class.
+
+        Parameters
+        ----------
+        attributes : :obj:`dict`[:obj:`str`, :obj:`type`]
+            The attribute/type pairs set by the derived class' constructor.
+
+        primitive
+            The collection of built in types.
+
+        """
+        self.attributes = dict(attributes)
+        self.fields = {
+            name: Field(name, setting_type, setting_type in primitive)
+            for name, setting_type in self.attributes.items()
+        }
+        self.static = all(isinstance(setting_type, type)
+                          for setting_type in self.attributes.values())
@@ -1,10 +1,129 @@
-import builtins
+import json
+import os
+import threading
 
+from collections import OrderedDict
+
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+
+from copy import copy
+
+from functools import partial
 from functools import wraps
 
+from hashlib import blake2b
+
+from itertools import islice
+
+from types import MappingProxyType
+
 import json_settings as js
 
 
+FILE_CACHE = OrderedDict()
+
+FILE_CACHE_SIZE = 128
+
+EMPTY = MappingProxyType(dict())
+
+
+def validate_chunk(cls, documents) -> list:
+    """Validates a number of documents against a settings class with
+    :meth:`Settings.validate`.
+
+    Module level so that it can be sent to the worker processes of an
+    executor by :meth:`Settings.validate_many`.
+
+    """
+    rv = list()
+    for document in documents:
+        setting, errors = cls.validate(document)
+        rv.append(errors if setting is None else setting)
+    return rv
+
+
+def merge_patch(setting, source, patch):
+    """Merges a partial patch into the source of a settings object.
+
+    Dictionaries in `patch` are merged recursively into nested settings
+    objects; any other value replaces the value at its key. Only the
+    dictionaries on the patched paths are copied.
+
+    Parameters
+    ----------
+    setting : :class:`Settings`
+        The settings object built from `source`.
+
+    source : :obj:`Union`[:obj:`dict`, :obj:`list`]
+        The values `setting` was built from.
+
+    patch : :obj:`Any`
+        The values to be merged into `source`.
+
+    Returns
+    -------
+    :obj:`tuple`[:obj:`Any`, :obj:`List`[:obj:`list`]]
+        The merged source, and the addresses of the patched values in the
+        form accepted by :meth:`Settings.branch`. The empty address means
+        that `setting` must be rebuilt as a whole, e.g. if a key unknown to
+        its schema is patched.
+
+    """
+    if not isinstance(patch, dict) or not isinstance(source, dict) or \
+            isinstance(setting, js.ListSetting):
+        return patch, [[]]
+    rv = dict(source)
+    addresses = list()
+    for key, value in patch.items():
+        try:
+            node = setting.node(key)
+        except KeyError:
+            node = None
+        if isinstance(value, dict) and isinstance(node, Settings) and \
+                key in source:
+            rv[key], branch = merge_patch(node, source[key], value)
+            addresses.extend([key, *address] for address in branch)
+        else:
+            rv[key] = value
+            addresses.append([key])
+    if not isinstance(setting, js.DictionarySetting) and \
+            not patch.keys() <= type(setting).__schema__.fields.keys():
+        return rv, [[]]
+    return rv, addresses
+
+
+def fingerprint(setting) -> str:
+    """A stable digest of the values a settings object was built from.
+
+    The digest is the blake2b hash of a canonical JSON encoding of the values,
+    with sorted keys, so it does not depend on key order or on the process it
+    is computed in. It is computed once and cached on the settings object.
+
+    Parameters
+    ----------
+    setting : :class:`Settings`
+        The settings object.
+
+    Returns
+    -------
+    :obj:`str`
+        The hexadecimal digest.
+
+    """
+    try:
+        return setting.__fingerprint__
+    except AttributeError:
+        pass
+    encoding = json.dumps(setting._source(),
+                          sort_keys=True,
+                          separators=(",", ":"),
+                          default=repr)
+    rv = blake2b(encoding.encode(), digest_size=16).hexdigest()
+    setting.__fingerprint__ = rv
+    return rv
+
+
 class Settings:
     """A base class for building python objects out of :obj:`dict` object.
 
@@ -52,31 +171,221 @@ class Settings:
         print(settings.setting_1.subsetting_1)
             # this_is_a_string
 
+    Attributes
+    ----------
+    lazy : :obj:`bool`
+        A class attribute. If True, nested settings are only checked when
+        they are first read, or by :meth:`validate_all`.
+
+    compact : :obj:`bool`
+        A class attribute. If True, instances are stored with as little
+        overhead as possible, for classes with very many instances, e.g. the
+        items of a large :class:`~.ListSetting`. See :meth:`distribute`.
+
     """
+    lazy = False
+    compact = False
+    __nodes__ = EMPTY
+    __pending__ = EMPTY
+
     @staticmethod
     def assign(method):
         """A decorator that applies the
         :meth:`~.Settings.distribute` to parameter of the
         constructor of the derived class.
 
+        The attribute/type pairs defined by the constructor body of the
+        first instance of each class are compiled into a :class:`~.Schema`,
+        stored on the class as `__schema__` and reused for every later
+        instance.
+
+        If the body only assigns types to attributes, it is not run again
+        for later instances, so it must not depend on the passed values or
+        have any other side effects. If it assigns anything other than a
+        type, e.g. options or values computed from the passed values, it is
+        run for every instance, as the assigned values may differ.
+
         """
         @wraps(method)
         def wrapper(self, *args):
-            method(self, *args)
-            self.distribute(*args)
+            self.prepare(method, *args)
+            collector = js.SettingErrorCollector.current()
+            if collector is None:
+                self.distribute(*args)
+            else:
+                count = len(collector.errors)
+                self.distribute(*args)
+                if len(collector.errors) > count:
+                    return
             try:
                 self.consistency_check()
             except AttributeError:
                 pass
         return wrapper
 
+    def prepare(self, method, *args):
+        """Assigns the attribute/type pairs of the compiled :class:`~.Schema`
+        of the class to the instance, compiling it by running the
+        constructor body `method` if it does not exist yet.
+
+        The body is run again instead if the schema is not
+        :attr:`~.Schema.static`.
+
+        """
+        cls = type(self)
+        schema = cls.__dict__.get("__schema__")
+        if schema is None:
+            method(self, *args)
+            cls.__schema__ = js.Schema(self.__dict__, self.primitive)
+        elif not schema.static:
+            method(self, *args)
+        elif not cls.compact:
+            self.__dict__.update(schema.attributes)
+
+    @classmethod
+    def validate(cls, values):
+        """Constructs an instance of the class in collect-all-errors mode.
+
+        Instead of stopping at the first error, every setting is checked in a
+        single pass and all the errors are returned together. The messages
+        of the errors are only built when they are displayed.
+
+        Parameters
+        ----------
+        values : :obj:`dict`
+            The values to construct the instance from.
+
+        Returns
+        -------
+        :obj:`tuple`[:obj:`Union`[:class:`Settings`, None], :obj:`list`]
+            The instance, or None if any errors were found, and the list of
+            :class:`~.SettingErrorMessage` found, with their full routes.
+
+        """
+        with js.SettingErrorCollector() as collector:
+            try:
+                rv = cls(values)
+            except js.SettingErrorMessage as e:
+                collector.add(e)
+            except js.error.Error as e:
+                collector.add(
+                    js.SettingErrorMessage(cls.__name__, original_error=e))
+        if collector.errors:
+            return None, collector.errors
+        return rv, collector.errors
+
+    @classmethod
+    def validate_many(cls,
+                      documents,
+                      workers: int = None,
+                      executor: Executor = None,
+                      chunk_size: int = 1024) -> list:
+        """Validates a batch of documents against the class, with
+        :meth:`validate`.
+
+        Parameters
+        ----------
+        documents : :obj:`Iterable`[:obj:`dict`]
+            The documents to be validated.
+
+        workers : :obj:`int`
+            If given, the documents are validated across a pool of this many
+            processes.
+
+        executor : :obj:`concurrent.futures.Executor`
+            An existing executor to validate the documents with. Takes
+            precedence over `workers`. It is not shut down afterwards.
+
+        chunk_size : :obj:`int`
+            The number of documents sent to a worker at a time.
+
+        Returns
+        -------
+        :obj:`list`
+            For each document, in order, either the validated instance or the
+            list of :class:`~.SettingErrorMessage` found in it.
+
+        """
+        if executor is None and not workers:
+            return validate_chunk(cls, documents)
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return cls.validate_many(documents,
+                                         executor=pool,
+                                         chunk_size=chunk_size)
+        documents = iter(documents)
+        chunks = iter(lambda: list(islice(documents, chunk_size)), [])
+        return [
+            result
+            for chunk in executor.map(partial(validate_chunk, cls), chunks)
+            for result in chunk
+        ]
+
+    @classmethod
+    def from_file(cls, path: str):
+        """Constructs an instance of the class from a JSON file.
+
+        The :data:`FILE_CACHE_SIZE` most recently read instances are cached,
+        keyed on the class and the real path of the file. If the modification
+        time and size of the file are unchanged since it was last read, a
+        copy of the cached instance is returned without reading the file
+        again. The copy shares its nested settings objects with the cached
+        instance, so only its own attributes may be reassigned.
+
+        Parameters
+        ----------
+        path : :obj:`str`
+            The path of the JSON file.
+
+        Returns
+        -------
+        :class:`Settings`
+            The validated instance.
+
+        """
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        key = (cls, path)
+        try:
+            mtime, size, rv = FILE_CACHE[key]
+            if mtime == stat.st_mtime_ns and size == stat.st_size:
+                FILE_CACHE.move_to_end(key)
+                return copy(rv)
+        except KeyError:
+            pass
+        with open(path, 'r') as f:
+            rv = cls(json.load(f))
+        FILE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, rv)
+        FILE_CACHE.move_to_end(key)
+        while len(FILE_CACHE) > FILE_CACHE_SIZE:
+            FILE_CACHE.popitem(last=False)
+        return copy(rv)
+
+    @classmethod
+    def from_files(cls, paths):
+        """Constructs an instance of the class from each of a number of JSON
+        files, with :meth:`from_file`.
+
+        Parameters
+        ----------
+        paths : :obj:`Iterable`[:obj:`str`]
+            The paths of the JSON files.
+
+        Returns
+        -------
+        :obj:`List`[:class:`Settings`]
+            The validated instances, in the order of `paths`.
+
+        """
+        return [cls.from_file(path) for path in paths]
+
     @property
     def primitive(self):
-        """:obj:`list`(:obj:`type`) : a list of built in types.
+        """:obj:`frozenset`(:obj:`type`) : the built in types, plus any added
+        with :func:`~.register_primitive`.
 
         """
-        return [getattr(builtins, d) for d in dir(builtins) if
-                isinstance(getattr(builtins, d), type)]
+        return js.schema.PRIMITIVE_TYPES
 
     def distribute(self, values: dict):
         """The method which loops over the attribute/type pairs in the derived
@@ -110,64 +419,301 @@ class Settings:
 
         Note
         ----
+        If a :class:`~.SettingErrorCollector` is active, the errors of each
+        setting are recorded in it and the remaining settings are still
+        checked, instead of raising.
+
         If the setting found in the `values` is None, then this function will
         assign None as the setting value by default, independent of the
         expected value.
 
+        If the class attribute :attr:`lazy` is True, the values of attributes
+        whose type is derived from :class:`Settings` are only recorded in the
+        `__pending__` attribute. Each is checked and assigned the first time
+        the attribute is read, or by :meth:`validate_all`, under the lock in
+        the `__lock__` attribute, so that threads sharing the instance
+        resolve each attribute once.
+
+        Nested setting instances are kept in the `__nodes__` attribute. If
+        their type is derived from :class:`~.TerminusSetting`,
+        :class:`~.ListSetting` or :class:`~.DictionarySetting`, the attribute
+        itself is assigned the value of their `get` attribute, so that reading
+        it costs the same as reading a plain attribute.
+
+        If the class attribute :attr:`compact` is True, nodes of
+        :class:`~.TerminusSetting` derived types that do not hold a range are
+        not kept, and are rebuilt by :meth:`node` when needed, and
+        `__nodes__` is only created once a node is kept. Instances nested in
+        another settings object do not keep `__source__`; it is rebuilt by
+        :meth:`_source`. The attributes are never given their type as a
+        placeholder, which on CPython 3.11 and later keeps them in the inline
+        layout of the interpreter, without an instance dictionary. On earlier
+        versions every instance still has its own dictionary, and only the
+        nodes and `__source__` are saved. `__slots__` can not remove the
+        dictionary, as :class:`Settings` itself has one.
+
         """
-        for setting, setting_type in self.__dict__.items():
-            if not isinstance(values, dict):
-                raise js.SettingTypeError(dict, type(values))
+        if not isinstance(values, dict):
+            raise js.SettingTypeError(dict, type(values))
+        collector = js.SettingErrorCollector.current()
+        compact = type(self).compact
+        if not compact:
+            self.__nodes__ = dict()
+        lazy = type(self).lazy and collector is None
+        if lazy:
+            self.__pending__ = dict()
+            self.__lock__ = threading.Lock()
+        for setting, field in self.__schema__.fields.items():
             try:
                 try:
                     value = values[setting]
                 except KeyError:
                     raise js.SettingNotFoundError()
             except js.SettingNotFoundError as e:
-                raise js.SettingErrorMessage(setting, original_error=e)
-            if setting_type not in self.primitive:
-                try:
-                    setattr(self, setting, setting_type(value))
-                except js.SettingTypeError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
-                except js.SettingCheckError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
-                except js.SettingNotFoundError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
-                except js.SettingRangeTypeError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
-                except js.SettingRangeKeyError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
-                except js.SettingStringSelectionError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
-                except js.ConsistencyError as e:
+                if collector is None:
                     raise js.SettingErrorMessage(setting, original_error=e)
-                except js.SettingErrorMessage as e:
-                    raise js.SettingErrorMessage(setting, branch_error=e)
-            elif value is None:
-                setattr(self, setting, value)
+                collector.add(js.SettingErrorMessage(setting,
+                                                     original_error=e))
+                continue
+            if lazy and field.nested:
+                self.__pending__[setting] = value
+                if not compact:
+                    self.__dict__.pop(setting, None)
+            elif collector is None:
+                self.assign_value(setting, value)
             else:
-                try:
-                    if isinstance(value, setting_type):
-                        setattr(self, setting, value)
-                    else:
-                        raise js.SettingTypeError(setting_type, type(value))
-                except js.SettingTypeError as e:
-                    raise js.SettingErrorMessage(setting, original_error=e)
+                collector.run(setting, self.assign_value, setting, value)
         self.__source__ = values
 
-    def __getattribute__(self, name):
-        rv = object.__getattribute__(self, name)
-        if issubclass(type(rv), js.TerminusSetting):
-            return rv.get
-        elif issubclass(type(rv), js.DictionarySetting):
-            return rv.get
-        elif issubclass(type(rv), js.ListSetting):
-            return rv.get
-        elif issubclass(type(rv), js.NumberSetting):
-            return rv.get
+    def assign_value(self, setting: str, value):
+        """Checks a single value against the expected type of an attribute
+        and assigns it.
+
+        Parameters
+        ----------
+        setting : :obj:`str`
+            The name of the attribute.
+
+        value : :obj:`Any`
+            The value found for the attribute.
+
+        Raises
+        ------
+        :class:`~.SettingErrorMessage`
+            If the value is not of the expected type, or any exceptions are
+            raised when instantiating the expected type from it.
+
+        """
+        field = self.__schema__.fields[setting]
+        setting_type = field.type
+        if not field.primitive:
+            try:
+                node = setting_type(value)
+            except js.SettingTypeError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.SettingCheckError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.SettingNotFoundError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.SettingRangeTypeError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.SettingRangeKeyError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.SettingStringSelectionError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.ConsistencyError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+            except js.SettingErrorMessage as e:
+                raise e.prepend(setting)
+            if field.compact:
+                del node.__source__
+            self.attach(setting, node)
+        elif value is None:
+            setattr(self, setting, value)
         else:
-            return rv
+            try:
+                if isinstance(value, setting_type):
+                    setattr(self, setting, value)
+                else:
+                    raise js.SettingTypeError(setting_type, type(value))
+            except js.SettingTypeError as e:
+                raise js.SettingErrorMessage(setting, original_error=e)
+
+    def node(self, setting: str):
+        """Returns the setting instance stored for an attribute.
+
+        """
+        if setting in self.__pending__:
+            getattr(self, setting)
+        try:
+            return self.__nodes__[setting]
+        except KeyError:
+            field = self.__schema__.fields[setting]
+            if not type(self).compact or not field.unwrap:
+                raise
+        return field.type(getattr(self, setting))
+
+    def validate_all(self):
+        """Checks and assigns every pending attribute of a lazy instance, and
+        of all the settings instances nested in it.
+
+        Returns
+        -------
+        :class:`Settings`
+            The instance itself.
+
+        Raises
+        ------
+        :class:`~.SettingErrorMessage`
+            If any of the pending values fail their checks.
+
+        """
+        for setting in list(self.__pending__):
+            getattr(self, setting)
+        for node in self.__nodes__.values():
+            if isinstance(node, Settings):
+                node.validate_all()
+        return self
+
+    def __getattr__(self, name):
+        pending = self.__pending__
+        if name not in pending:
+            raise AttributeError(f"'{type(self).__name__}' object has no "
+                                 f"attribute '{name}'")
+        with self.__lock__:
+            if name in pending:
+                self.assign_value(name, pending[name])
+                pending.pop(name, None)
+        return getattr(self, name)
+
+    def attach(self, setting: str, node):
+        """Assigns an already validated setting instance to an attribute.
+
+        """
+        field = self.__schema__.fields[setting]
+        if not field.terminus or not type(self).compact or \
+                getattr(node, "is_range", False):
+            if self.__nodes__ is EMPTY:
+                self.__nodes__ = dict()
+            self.__nodes__[setting] = node
+        if field.unwrap:
+            setattr(self, setting, node.get)
+        else:
+            setattr(self, setting, node)
+
+    def branch(self, addresses: list, source):
+        """Returns a copy of the settings object in which only the values at
+        `addresses` are replaced by the values at the same addresses in
+        `source`.
+
+        Only the settings objects on the paths from this object to the
+        addresses are copied, and their consistency checks re-run. The
+        values at the addresses are checked as they would be on
+        construction. Every other branch is shared with this object.
+
+        Parameters
+        ----------
+        addresses : :obj:`List`[:obj:`list`]
+            The addresses of the replaced values, relative to this object.
+
+        source : :obj:`Union`[:obj:`dict`, :obj:`list`]
+            The values of the copy, already containing the replaced values.
+
+        Returns
+        -------
+        :class:`Settings`
+            The copy.
+
+        Raises
+        ------
+        :class:`~.SettingErrorMessage`
+            If any of the replaced values, or the consistency checks of the
+            copied objects, fail.
+
+        """
+        rv = copy(self)
+        if hasattr(self, "__source__"):
+            rv.__source__ = source
+        groups = dict()
+        for address in addresses:
+            groups.setdefault(address[0], list()).append(address[1:])
+        for key, branch in groups.items():
+            if not all(branch):
+                rv.assign_value(key, source[key])
+                continue
+            name = f"[{key}]" if isinstance(key, int) else key
+            try:
+                node = self.node(key).branch(branch, source[key])
+            except js.ConsistencyError as e:
+                raise js.SettingErrorMessage(name, original_error=e)
+            except js.SettingErrorMessage as e:
+                raise e.prepend(name)
+            rv.attach(key, node)
+        try:
+            rv.consistency_check()
+        except AttributeError:
+            pass
+        return rv
+
+    def update(self, patch: dict):
+        """Applies a partial patch to the settings object in place.
+
+        The patch is merged into the values the object was built from, as
+        returned by :meth:`_source`, with :func:`merge_patch`, and only the values on the patched paths are
+        checked again, along with the consistency checks of the settings
+        objects containing them, as in :meth:`branch`. The nested settings
+        objects on those paths are replaced by copies, so other references
+        to the previous ones are left unchanged.
+
+        If any check fails, the settings object is left unchanged.
+
+        Parameters
+        ----------
+        patch : :obj:`dict`
+            The values to be changed, nested as in :meth:`_source`.
+
+        Returns
+        -------
+        :class:`Settings`
+            The settings object itself.
+
+        Raises
+        ------
+        :class:`~.SettingErrorMessage`
+            If any of the patched values, or the consistency checks of the
+            settings objects containing them, fail.
+
+        """
+        source, addresses = merge_patch(self, self._source(), patch)
+        if [] in addresses:
+            rv = type(self)(source)
+            if "__source__" not in self.__dict__:
+                rv.__dict__.pop("__source__", None)
+        else:
+            rv = self.branch(addresses, source)
+        self.__dict__.clear()
+        self.__dict__.update(rv.__dict__)
+        return self
+
+    def __copy__(self):
+        rv = object.__new__(type(self))
+        rv.__dict__.update(self.__dict__)
+        rv.__dict__.pop("__fingerprint__", None)
+        rv.__nodes__ = dict(self.__nodes__)
+        if self.__pending__:
+            rv.__pending__ = dict(self.__pending__)
+            rv.__lock__ = threading.Lock()
+        return rv
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("__lock__", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.__pending__:
+            self.__lock__ = threading.Lock()
 
     def __enter__(self):
         return self
@@ -175,11 +721,32 @@ class Settings:
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
+    def _source(self) -> dict:
+        """The values the instance was built from.
+
+        This is the `__source__` attribute if it is kept. Otherwise, for
+        nested instances of :attr:`compact` classes, it is rebuilt from the
+        checked values.
+
+        """
+        try:
+            return self.__source__
+        except AttributeError:
+            pass
+        rv = dict()
+        for setting, field in self.__schema__.fields.items():
+            if setting in self.__pending__:
+                rv[setting] = self.__pending__[setting]
+            elif setting in self.__nodes__:
+                rv[setting] = self.__nodes__[setting]._source()
+            else:
+                rv[setting] = getattr(self, setting)
+        return rv
+
     def __hash__(self):
-        return hash(str(self.__source__))
+        return hash(fingerprint(self))
 
     def __eq__(self, other):
-        if other.__hash__() == self.__hash__():
-            return True
-        else:
-            return False
+        if not isinstance(other, Settings):
+            return NotImplemented
+        return fingerprint(self) == fingerprint(other)
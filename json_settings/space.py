@@ -1,17 +1,31 @@
-import itertools
+import json
 import operator
+import os
 import warnings
 
 from collections.abc import Iterable
 
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+
+from copy import copy
 from copy import deepcopy
 
+from functools import lru_cache
+from functools import partial
 from functools import reduce
 
+from typing import List
 from typing import Type
 from typing import Union
 
+from numpy import asarray
+from numpy import broadcast_to
+from numpy import integer
+from numpy import load
+from numpy import ndarray
 from numpy import prod
+from numpy import savez_compressed
 from numpy import unravel_index
 
 import json_settings as js
@@ -21,6 +35,16 @@ def custom_formatwarning(msg, *args, **kwargs):
     return "Warning: " + str(msg) + '\n'
 
 
+def build_chunk(space, indices: range):
+    """Builds the points of a space at a range of linear indices.
+
+    Module level so that it can be sent to the worker processes of an
+    executor by :meth:`Space.build_space`.
+
+    """
+    return [space.build_point(idx) for idx in indices]
+
+
 warnings.formatwarning = custom_formatwarning
 
 
@@ -43,11 +67,39 @@ class Space:
         same name as a key in :attr:`restrict` is found, only subsettings with
         name equal to the corresponding key will be searched.
 
+    lazy : :obj:`bool`
+        If True, the points of the space are built on demand when accessed
+        rather than all at once on construction.
+
+    strides : :obj:`List`[:obj:`int`]
+        The number of points spanned by a unit step along each axis.
+
+    axis_addresses : :obj:`List`[:obj:`List`[:obj:`list`]]
+        The addresses of the range values that vary along each axis.
+
+    axis_match : :obj:`List`[:obj:`Union`[None, :obj:`str`]]
+        The match id of each axis, or None if the axis is a single range.
+
+    parent : :obj:`Union`[None, :class:`Space`]
+        The space that a sub-space view was indexed from, or None.
+
+    selection : :obj:`List`[:obj:`Union`[:obj:`int`, :obj:`range`]]
+        For each axis of :attr:`parent`, the index it is fixed at or the range
+        of its indices that form an axis of this space.
+
+    fixed : :obj:`List`[:obj:`tuple`]
+        The addresses and value of each axis of :attr:`parent` fixed by
+        :attr:`selection`.
+
     """
 
     def __init__(self,
                  setting: Type[js.Settings],
-                 restrict: js.StringDict = {}):
+                 restrict: js.StringDict = {},
+                 lazy: bool = False,
+                 cache: int = 0,
+                 workers: int = None,
+                 executor: Executor = None):
         """The constructor for the :class:`Space` class.
 
         Parameters
@@ -62,16 +114,40 @@ class Space:
             name as a key in :attr:`restrict` is found, only subsettings with
             name equal to the corresponding key will be searched.
 
+        lazy : :obj:`bool`
+            If True, no points are built on construction. Each point is built
+            from the axes when it is accessed.
+
+        cache : :obj:`int`
+            The number of recently built points kept by a lazy space. Ignored
+            if `lazy` is False.
+
+        workers : :obj:`int`
+            If given, the points are built across a pool of this many
+            processes. Ignored if `lazy` is True.
+
+        executor : :obj:`concurrent.futures.Executor`
+            An existing executor to build the points with. Takes precedence
+            over `workers`. Ignored if `lazy` is True.
+
         """
         self.setting = setting
         self.restrict = restrict
+        self.lazy = lazy
         self.addresses = list()
         self.values = list()
         self.matched = dict()
         self.unmatched = list()
         self.space = list()
+        self.setting.validate_all()
         self.explore(self.setting, list())
-        self.build_space()
+        self.build_axes()
+        if lazy and cache:
+            self.point = lru_cache(maxsize=cache)(self.build_point)
+        else:
+            self.point = self.build_point
+        if not lazy:
+            self.build_space(workers, executor)
 
     def get_by_address(self, root: dict, address: js.StringList):
         return reduce(operator.getitem, address, root)
@@ -79,15 +155,35 @@ class Space:
     def set_by_address(self, root: dict, address, value):
         self.get_by_address(root, address[:-1])[address[-1]] = value
 
+    def copy_by_address(self, root: dict, addresses: list):
+        """Copies the containers on the paths from `root` to each of
+        `addresses`.
+
+        Every other branch of the returned copy is shared with `root`, so
+        setting the values at `addresses` in the copy leaves `root`
+        unchanged.
+
+        """
+        rv = copy(root)
+        copied = {id(rv)}
+        for address in addresses:
+            node = rv
+            for key in address[:-1]:
+                item = node[key]
+                if id(item) not in copied:
+                    item = copy(item)
+                    copied.add(id(item))
+                    node[key] = item
+                node = item
+        return rv
+
     def explore(self, root, path, restrict=None):
         if issubclass(type(root), js.ListSetting):
             branch = enumerate(root.value)
         elif issubclass(type(root), js.DictionarySetting):
             branch = root.items()
         elif issubclass(type(root), js.Settings):
-            branch = [
-                (k, v) for k, v in root.__dict__.items() if "__" not in k
-            ]
+            branch = list(root.__nodes__.items())
         else:
             branch = list()
         if restrict:
@@ -120,53 +216,360 @@ class Space:
                         break
                 self.explore(item, new_path, new_restrict)
 
-    def build_space(self):
+    def build_axes(self):
+        """Appends the zipped values of each group of matched ranges to the
+        axes found by :meth:`explore`, and computes :attr:`strides` and
+        :attr:`axis_addresses`.
+
+        A group containing a :class:`~.Range` is zipped into a
+        :class:`~.Zipped`, so that the range is not expanded.
+
+        """
+        self.axis_addresses = [[address] for address in self.addresses]
+        self.axis_match = [None] * len(self.addresses)
         for match, items in self.matched.items():
+            self.axis_addresses.append(items["addresses"])
+            self.axis_match.append(match)
             self.addresses += items["addresses"]
             if len({len(i) for i in items["values"]}) != 1:
                 warnings.warn(f"ranges with match id '{match}' have unequal "
                               f"length. Zipped to shortest.")
-            self.values.append(list(zip(*items["values"])))
-        for batch in itertools.product(*self.values):
-            flat_batch = list()
-            for item in batch:
-                if isinstance(item, Iterable):
-                    for subitem in item:
-                        flat_batch.append(subitem)
-                else:
-                    flat_batch.append(item)
-            rv = deepcopy(self.setting.__source__)
-            for address, value in zip(self.addresses, flat_batch):
-                self.set_by_address(rv, address, float(value))
-            self.space.append(type(self.setting)(rv))
+            if any(isinstance(column, js.Range)
+                   for column in items["values"]):
+                self.values.append(js.Zipped(items["values"]))
+            else:
+                self.values.append(list(zip(*items["values"])))
+        self.strides = [
+            int(prod([len(v) for v in self.values[idx + 1:]]))
+            for idx in range(len(self.values))
+        ]
+        self.lookup = None
+        self.parent = None
+        self.selection = [range(len(v)) for v in self.values]
+        self.fixed = list()
+
+    def select(self, selection: list):
+        """Creates a lazy sub-space view of the space.
+
+        The view builds no points. Its points are fetched from, or built by,
+        :attr:`parent` when accessed.
+
+        Parameters
+        ----------
+        selection : :obj:`List`[:obj:`Union`[:obj:`int`, :obj:`slice`]]
+            For each axis of this space, the index to fix it at, or the slice
+            of its indices to keep as an axis of the view.
+
+        Returns
+        -------
+        :class:`Space`
+            The view, whose :attr:`parent` is the space this space was
+            constructed as.
+
+        """
+        root = self if self.parent is None else self.parent
+        rv = object.__new__(Space)
+        rv.__dict__.update(self.__dict__)
+        rv.parent = root
+        rv.selection = list(self.selection)
+        kept = [axis for axis, item in enumerate(self.selection)
+                if isinstance(item, range)]
+        for axis, item in zip(kept, selection):
+            rv.selection[axis] = self.selection[axis][item]
+        rv.addresses = list()
+        rv.values = list()
+        rv.axis_addresses = list()
+        rv.axis_match = list()
+        rv.unmatched = list()
+        rv.matched = dict()
+        rv.fixed = list()
+        for axis, item in enumerate(rv.selection):
+            addresses = root.axis_addresses[axis]
+            match = root.axis_match[axis]
+            if not isinstance(item, range):
+                rv.fixed.append((addresses, root.values[axis][item]))
+                continue
+            values = root.values[axis][
+                slice(item.start, None if item.stop < 0 else item.stop,
+                      item.step)]
+            rv.addresses += addresses
+            rv.values.append(values)
+            rv.axis_addresses.append(addresses)
+            rv.axis_match.append(match)
+            if match is None:
+                rv.unmatched += addresses
+            else:
+                rv.matched[match] = {
+                    "addresses": addresses,
+                    "values": values.columns
+                    if isinstance(values, js.Zipped) else
+                    [list(column) for column in zip(*values)]
+                }
+        rv.strides = [
+            int(prod([len(v) for v in rv.values[idx + 1:]]))
+            for idx in range(len(rv.values))
+        ]
+        rv.lookup = None
+        rv.space = list()
+        rv.point = rv.element
+        return rv
+
+    def parent_index(self, index: int) -> int:
+        """Converts a linear index of a sub-space view to the linear index of
+        the same point in :attr:`parent`.
+
+        """
+        rv = 0
+        strides = iter(self.strides)
+        for item, parent_stride in zip(self.selection, self.parent.strides):
+            if isinstance(item, range):
+                stride = next(strides)
+                item = item[index // stride]
+                index %= stride
+            rv += item * parent_stride
+        return rv
+
+    def element(self, index: int) -> Type[js.Settings]:
+        """Returns the point at a linear index of the space, building it if it
+        has not been built.
+
+        """
+        if self.parent is not None:
+            return self.parent.element(self.parent_index(index))
+        if self.lazy:
+            return self.point(index)
+        return self.space[index]
+
+    def build_point(self, index: int) -> Type[js.Settings]:
+        """Builds the settings object at a linear index of the space.
+
+        The point is branched from :attr:`setting`, so only the range values
+        and the settings objects that contain them are revalidated.
+
+        Parameters
+        ----------
+        index : :obj:`int`
+            The linear index of the point.
+
+        Returns
+        -------
+        :obj:`Type`[:class:`~.Settings`]
+            The settings object with the range values at `index`.
+
+        """
+        if self.parent is not None:
+            return self.parent.build_point(self.parent_index(index))
+        flat_batch = list()
+        for values, stride in zip(self.values, self.strides):
+            item = values[index // stride]
+            index %= stride
+            if isinstance(item, Iterable):
+                for subitem in item:
+                    flat_batch.append(subitem)
+            else:
+                flat_batch.append(item)
+        rv = self.copy_by_address(self.setting.__source__, self.addresses)
+        for address, value in zip(self.addresses, flat_batch):
+            self.set_by_address(rv, address, float(value))
+        return self.setting.branch(self.addresses, rv)
+
+    def build_space(self, workers: int = None, executor: Executor = None):
+        """Builds every point of the space and stores them in :attr:`space`.
+
+        If `workers` or `executor` is given, the linear indices are split into
+        contiguous chunks that are built in parallel. The chunks are gathered
+        in order, so :attr:`space` is the same as when built serially.
+
+        Parameters
+        ----------
+        workers : :obj:`int`
+            The number of processes to build the points across.
+
+        executor : :obj:`concurrent.futures.Executor`
+            An existing executor to build the points with. It is not shut
+            down afterwards.
+
+        """
+        indices = range(len(self))
+        if executor is None and not workers:
+            self.space = build_chunk(self, indices)
+            return
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                self.build_space(workers, pool)
+            return
+        count = (workers or os.cpu_count() or 1) * 4
+        size = -(-len(indices) // count) or 1
+        chunks = [indices[idx:idx + size]
+                  for idx in range(0, len(indices), size)]
+        self.space = [
+            point
+            for chunk in executor.map(partial(build_chunk, self), chunks)
+            for point in chunk
+        ]
 
     def __getitem__(self, indices):
-        if isinstance(indices, tuple):
-            if len(indices) > len(self.values):
-                raise IndexError(f"too many indices for array {self.shape}")
-            for idx, item in enumerate(indices):
-                if not isinstance(item, int):
-                    raise IndexError(
-                        "only integers are valid when accessing arrays")
-                if not 0 <= item < self.shape[idx]:
-                    raise IndexError(f"index {item} is out of bounds for axis "
-                                     f"{idx} with size {self.shape[idx]}")
+        """Indexes the space in the same way as a :obj:`numpy.ndarray`.
+
+        Returns the point if an integer is given for every axis, otherwise
+        a lazy sub-space view created by :meth:`select`. Negative integers,
+        slices and an ellipsis are supported.
+
+        """
+        if not isinstance(indices, tuple):
+            indices = (indices,)
+        shape = self.shape
+        ellipsis = [idx for idx, item in enumerate(indices)
+                    if item is Ellipsis]
+        if len(ellipsis) > 1:
+            raise IndexError("an index can only have a single ellipsis "
+                             "('...')")
+        if ellipsis:
+            fill = max(0, len(shape) - len(indices) + 1)
+            indices = indices[:ellipsis[0]] + (slice(None),) * fill + \
+                indices[ellipsis[0] + 1:]
+        if len(indices) > len(shape):
+            raise IndexError(f"too many indices for array {shape}")
+        selection = list()
+        for idx, item in enumerate(indices):
+            if isinstance(item, slice):
+                selection.append(item)
+                continue
+            if isinstance(item, bool) or \
+                    not isinstance(item, (int, integer)):
+                raise IndexError("only integers, slices (`:`) and ellipsis "
+                                 "(`...`) are valid indices")
+            if not -shape[idx] <= item < shape[idx]:
+                raise IndexError(f"index {item} is out of bounds for axis "
+                                 f"{idx} with size {shape[idx]}")
+            selection.append(int(item) % shape[idx])
+        if len(selection) == len(shape) and \
+                not any(isinstance(i, slice) for i in selection):
             index = 0
-            for idx, item in enumerate(indices):
-                index += item * int(
-                    prod([len(v) for v in self.values[idx + 1:]]))
-        elif isinstance(indices, int):
-            if len(self.values) > 1:
-                raise IndexError(f"too many indices for array {self.shape}")
-            if not 0 <= indices < self.shape[0]:
-                raise IndexError(
-                    f"index {indices} is out of bounds for axis {0} "
-                    f"with size {self.shape[0]}")
-            index = indices
+            for item, stride in zip(selection, self.strides):
+                index += item * stride
+            return self.element(index)
+        if not self.values:
+            return self
+        return self.select(selection)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self.element(idx)
+
+    def grid(self) -> List[ndarray]:
+        """The coordinates of every point of the space, without building any
+        points.
+
+        Returns
+        -------
+        :obj:`List`[:obj:`numpy.ndarray`]
+            One array of shape :attr:`shape` for each address in
+            :attr:`addresses`, in the same order. Element `idx` of each array
+            is the value at that address of the point at `space[idx]`. The
+            arrays are read only views.
+
+        """
+        rv = list()
+        for axis, values in enumerate(self.values):
+            view = [1] * len(self.values)
+            view[axis] = len(values)
+            columns = asarray(values, dtype=float).reshape(
+                len(values), len(self.axis_addresses[axis]))
+            for column in columns.T:
+                rv.append(broadcast_to(column.reshape(view), self.shape))
+        return rv
+
+    def shard(self, index: int, count: int, strategy: str = "block"):
+        """The linear indices of the points assigned to one of a number of
+        workers, without building any points.
+
+        Parameters
+        ----------
+        index : :obj:`int`
+            The index of the worker, from 0 to `count` - 1.
+
+        count : :obj:`int`
+            The number of workers.
+
+        strategy : :obj:`str`
+            "block" to assign each worker a contiguous block of indices, with
+            block sizes differing by at most one. "cyclic" to assign every
+            `count`-th index, starting from `index`.
+
+        Returns
+        -------
+        :obj:`range`
+            The linear indices of the shard. Pass its `start`, `stop` and
+            `step` to :meth:`iter` to walk its points.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If `count` is less than 1, `index` is not a valid worker index or
+            `strategy` is unknown.
+
+        """
+        if count < 1:
+            raise ValueError("count must be >= 1")
+        if not 0 <= index < count:
+            raise ValueError(f"index must be in [0, {count})")
+        if strategy == "block":
+            size, remainder = divmod(len(self), count)
+            start = index * size + min(index, remainder)
+            return range(start, start + size + (index < remainder))
+        elif strategy == "cyclic":
+            return range(index, len(self), count)
         else:
-            raise IndexError("only integers are valid when accessing arrays")
+            raise ValueError(f"unknown strategy '{strategy}', must be one of "
+                             f"['block', 'cyclic']")
 
-        return self.space[index]
+    def iter(self, batch_size: int = None, start: int = None,
+             stop: int = None, step: int = None):
+        """A generator over the points of the space in linear index order.
+
+        Points of a lazy space are built as they are yielded and are not
+        cached, so no earlier points are kept alive by the space.
+
+        Parameters
+        ----------
+        batch_size : :obj:`int`
+            If given, lists of up to `batch_size` points are yielded instead
+            of single points.
+
+        start : :obj:`int`
+            The linear index of the first point.
+
+        stop : :obj:`int`
+            The linear index one past the last point.
+
+        step : :obj:`int`
+            The step between the linear indices of consecutive points.
+
+        Yields
+        ------
+        :obj:`Union`[:class:`~.Settings`, :obj:`List`[:class:`~.Settings`]]
+            The next point, or batch of points.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If `batch_size` is less than 1.
+
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        indices = range(len(self))[start:stop:step]
+        if self.lazy:
+            build = self.build_point
+        else:
+            build = self.element
+        if batch_size is None:
+            for idx in indices:
+                yield build(idx)
+        else:
+            for idx in range(0, len(indices), batch_size):
+                yield [build(i) for i in indices[idx:idx + batch_size]]
 
     @property
     def shape(self):
@@ -177,15 +580,15 @@ class Space:
 
     @property
     def zero(self) -> Union[Type[js.Settings], None]:
-        if len(self.space) == 1:
-            return self.space[0]
+        if len(self) == 1:
+            return self.element(0)
         else:
             return None
 
     @property
     def axes(self):
         for item, space in zip(self.addresses, self.values):
-            print(self.build_path(item), space)
+            print(self.build_path(item), list(space))
 
     def build_path(self, elements: js.StringList):
         rv = ""
@@ -206,7 +609,7 @@ class Space:
             rv += "\n"
             rv += f"\t{self.build_path(item)}"
             rv += "\n"
-            rv += fill(f"\tvalues:  {self.values[idx]}\n",
+            rv += fill(f"\tvalues:  {list(self.values[idx])}\n",
                        width=70,
                        subsequent_indent="\t")
             axis += 1
@@ -230,7 +633,237 @@ class Space:
         return unravel_index(linear_index, self.shape)
 
     def linear_index(self, setting: Type[js.Settings]):
-        return self.space.index(setting)
+        """Computes the linear index of a point of the space from the values
+        at its range addresses.
+
+        The position of each value on its axis is looked up in a table built
+        on the first call, and combined with :attr:`strides`. No points are
+        built or compared.
+
+        Parameters
+        ----------
+        setting : :obj:`Type`[:class:`~.Settings`]
+            The settings object to be located.
+
+        Returns
+        -------
+        :obj:`int`
+            The linear index of `setting`.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If the value at any range address of `setting` is missing or is
+            not one of the values of its axis.
+
+        """
+        if self.lookup is None:
+            self.lookup = list()
+            for axis, values in enumerate(self.values):
+                if isinstance(values, (js.Range, js.Zipped)):
+                    self.lookup.append(values)
+                    continue
+                table = dict()
+                for idx, item in enumerate(values):
+                    if self.axis_match[axis] is None:
+                        item = float(item)
+                    else:
+                        item = tuple(float(i) for i in item)
+                    table.setdefault(item, idx)
+                self.lookup.append(table)
+        rv = 0
+        for axis, addresses in enumerate(self.axis_addresses):
+            try:
+                item = tuple(
+                    self.get_by_address(setting.__source__, address)
+                    for address in addresses)
+            except (KeyError, IndexError, TypeError):
+                raise ValueError(
+                    f"no value at {self.build_path(addresses[0])} for axis "
+                    f"{axis}")
+            if self.axis_match[axis] is None:
+                item = item[0]
+            table = self.lookup[axis]
+            try:
+                if isinstance(table, (js.Range, js.Zipped)):
+                    rv += table.index(item) * self.strides[axis]
+                else:
+                    rv += table[item] * self.strides[axis]
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(
+                    f"value {item} at "
+                    f"{', '.join(self.build_path(a) for a in addresses)} "
+                    f"is not on axis {axis}")
+        for addresses, value in self.fixed:
+            try:
+                item = [self.get_by_address(setting.__source__, address)
+                        for address in addresses]
+            except (KeyError, IndexError, TypeError):
+                item = None
+            if not isinstance(value, tuple):
+                value = (value,)
+            if item != [float(v) for v in value]:
+                raise ValueError(
+                    f"value {item} at "
+                    f"{', '.join(self.build_path(a) for a in addresses)} "
+                    f"is not {list(value)}")
+        return rv
+
+    def save(self, path: str):
+        """Saves the space to a single compressed :obj:`numpy` `.npz` file
+        that can be opened with :meth:`load`.
+
+        The file holds a JSON manifest of the template source, the class of
+        :attr:`setting`, the axis addresses, match ids and shape, and the
+        values of each range along each axis. The values of a
+        :class:`~.Range` of :obj:`int` or :obj:`float` are recorded by its
+        definition in the manifest, and any other values as an array. The
+        axes fixed by a sub-space view are written into the template source,
+        so the view is saved as a space of its own.
+
+        Parameters
+        ----------
+        path : :obj:`str`
+            The path of the file to write.
+
+        """
+        fixed = [a for addresses, _ in self.fixed for a in addresses]
+        source = self.copy_by_address(self.setting.__source__, fixed)
+        for addresses, value in self.fixed:
+            if not isinstance(value, tuple):
+                value = (value,)
+            for address, item in zip(addresses, value):
+                self.set_by_address(source, address, float(item))
+        setting_type = type(self.setting)
+        manifest = {
+            "setting": f"{setting_type.__module__}:"
+                       f"{setting_type.__qualname__}",
+            "source": source,
+            "restrict": self.restrict,
+            "axes": self.axis_addresses,
+            "match": self.axis_match,
+            "shape": list(self.shape),
+            "columns": list()
+        }
+        arrays = dict()
+        for axis, values in enumerate(self.values):
+            if isinstance(values, js.Zipped):
+                columns = values.columns
+            elif self.axis_match[axis] is None:
+                columns = [values]
+            else:
+                columns = list(zip(*values))
+            ranges = list()
+            for column, item in enumerate(columns):
+                if isinstance(item, js.Range) and item.type in (int, float):
+                    ranges.append({
+                        "min": item.min,
+                        "max": item.max,
+                        "num": item.num,
+                        "type": item.type.__name__,
+                        "indices": [item.indices.start,
+                                    item.indices.stop,
+                                    item.indices.step]
+                    })
+                else:
+                    ranges.append(None)
+                    arrays[f"axis_{axis}_{column}"] = asarray(item)
+            manifest["columns"].append(ranges)
+        with open(path, "wb") as f:
+            savez_compressed(f, manifest=json.dumps(manifest), **arrays)
+
+    @classmethod
+    def load(cls,
+             path: str,
+             setting_type: Type[js.Settings],
+             cache: int = 0):
+        """Opens a space saved by :meth:`save` as a lazy space.
+
+        Only the template is validated. The ranges are not explored again
+        and no points are built until they are accessed.
+
+        The class of the template is never imported from the file, so that
+        opening a file cannot run code. It must be passed, and match the
+        class recorded in the file.
+
+        Parameters
+        ----------
+        path : :obj:`str`
+            The path of the file to read.
+
+        setting_type : :obj:`Type`[:class:`~.Settings`]
+            The class of the template.
+
+        cache : :obj:`int`
+            The number of recently built points kept by the space.
+
+        Returns
+        -------
+        :class:`Space`
+            The lazy space.
+
+        Raises
+        ------
+        :obj:`TypeError`
+            If `setting_type` is not a :class:`~.Settings` class, or is not
+            the class recorded in the file.
+
+        """
+        if not isinstance(setting_type, type) or \
+                not issubclass(setting_type, js.Settings):
+            raise TypeError(f"{setting_type!r} is not a Settings class")
+        name = f"{setting_type.__module__}:{setting_type.__qualname__}"
+        types = {"int": int, "float": float}
+        with open(path, "rb") as f:
+            data = load(f)
+            manifest = json.loads(str(data["manifest"]))
+            if manifest["setting"] != name:
+                raise TypeError(f"the space was saved from "
+                                f"{manifest['setting']}, not {name}")
+            values = [
+                [data[f"axis_{axis}_{column}"].tolist() if item is None else
+                 js.Range(item["min"], item["max"], item["num"],
+                          types[item["type"]], range(*item["indices"]))
+                 for column, item in enumerate(ranges)]
+                for axis, ranges in enumerate(manifest["columns"])
+            ]
+        rv = object.__new__(cls)
+        rv.setting = setting_type(manifest["source"])
+        rv.restrict = manifest["restrict"]
+        rv.lazy = True
+        rv.addresses = list()
+        rv.values = list()
+        rv.matched = dict()
+        rv.unmatched = list()
+        rv.space = list()
+        for addresses, match, columns in zip(manifest["axes"],
+                                             manifest["match"],
+                                             values):
+            if match is None:
+                rv.unmatched.append(addresses[0])
+                rv.addresses.append(addresses[0])
+                rv.values.append(columns[0])
+            else:
+                rv.matched[match] = {
+                    "addresses": addresses,
+                    "values": columns
+                }
+        rv.build_axes()
+        if cache:
+            rv.point = lru_cache(maxsize=cache)(rv.build_point)
+        else:
+            rv.point = rv.build_point
+        return rv
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["point"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.point = self.build_point if self.parent is None else \
+            self.element
 
     def __enter__(self):
         return self
@@ -239,4 +872,4 @@ class Space:
         pass
 
     def __len__(self):
-        return len(self.space)
+        return int(prod(self.shape))
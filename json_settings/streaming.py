@@ -0,0 +1,250 @@
+import json
+
+from typing import IO
+
+import json_settings as js
+
+
+WHITESPACE = " \t\n\r"
+
+NUMBER = "0123456789.eE+-"
+
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+DECODER = json.JSONDecoder()
+
+
+class Reader:
+    """An incremental tokenizer over a text stream containing a single JSON
+    array or object.
+
+    Only the current chunk, plus any partial value carried over from the
+    previous chunk, is held in memory.
+
+    Attributes
+    ----------
+    stream : :obj:`IO`
+        The text stream being read.
+
+    chunk_size : :obj:`int`
+        The number of characters read from :attr:`stream` at a time.
+
+    offset : :obj:`int`
+        The position in the stream of the start of the buffer.
+
+    """
+
+    def __init__(self, stream: IO, chunk_size: int = 65536):
+        """The constructor for the :class:`Reader` class.
+
+        Parameters
+        ----------
+        stream : :obj:`IO`
+            The text stream to be read.
+
+        chunk_size : :obj:`int`
+            The number of characters read from `stream` at a time.
+
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.idx = 0
+        self.eof = False
+        self.offset = 0
+        self.lines = 0
+        self.column = 0
+
+    def read(self) -> bool:
+        """Appends the next chunk of the stream to the buffer, discarding the
+        part that has already been consumed.
+
+        Returns
+        -------
+        :obj:`bool`
+            False if the end of the stream has been reached.
+
+        """
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        consumed = self.buffer[:self.idx]
+        newline = consumed.rfind("\n")
+        if newline < 0:
+            self.column += len(consumed)
+        else:
+            self.lines += consumed.count("\n")
+            self.column = len(consumed) - newline - 1
+        self.offset += self.idx
+        self.buffer = self.buffer[self.idx:] + chunk
+        self.idx = 0
+        self.eof = not chunk
+        return not self.eof
+
+    def peek(self) -> str:
+        """Returns the next non whitespace character without consuming it, or
+        an empty string at the end of the stream.
+
+        """
+        while True:
+            while self.idx < len(self.buffer) and \
+                    self.buffer[self.idx] in WHITESPACE:
+                self.idx += 1
+            if self.idx < len(self.buffer) or not self.read():
+                return self.buffer[self.idx:self.idx + 1]
+
+    def error(self, msg: str, pos: int) -> json.JSONDecodeError:
+        """Builds the error for a position in the buffer, with the line,
+        column and character it is at in the whole stream.
+
+        """
+        lineno = self.lines + self.buffer.count("\n", 0, pos) + 1
+        newline = self.buffer.rfind("\n", 0, pos)
+        colno = pos - newline if newline >= 0 else self.column + pos + 1
+        rv = json.JSONDecodeError(msg, self.buffer, pos)
+        rv.pos = self.offset + pos
+        rv.lineno = lineno
+        rv.colno = colno
+        rv.args = (f"{msg}: line {lineno} column {colno} (char {rv.pos})",)
+        return rv
+
+    def truncated(self, error: json.JSONDecodeError) -> bool:
+        """Whether a decoding error may be due to the buffer ending part way
+        through a value, rather than to malformed JSON.
+
+        """
+        rest = self.buffer[error.pos:]
+        if not rest or error.msg.startswith("Unterminated string"):
+            return True
+        if error.msg.startswith("Invalid \\uXXXX"):
+            return len(rest) <= 5
+        return error.msg == "Expecting value" and \
+            any(item.startswith(rest) for item in LITERALS)
+
+    def expect(self, characters: str) -> str:
+        """Consumes the next non whitespace character.
+
+        Raises
+        ------
+        :obj:`json.JSONDecodeError`
+            If the character is not one of `characters`.
+
+        """
+        rv = self.peek()
+        if not rv or rv not in characters:
+            raise self.error(f"Expecting one of {list(characters)}",
+                             self.idx)
+        self.idx += 1
+        return rv
+
+    def value(self):
+        """Decodes and consumes the next JSON value.
+
+        A value that ends at the end of the buffer, or before a character
+        that may continue a number, e.g. the fraction of ``1.`` or the
+        exponent of ``3e``, may be truncated, so more of the stream is read
+        and it is decoded again. So is a value that fails to decode only
+        because the buffer ends part way through it. Any other error is
+        raised at once, without reading further.
+
+        """
+        self.peek()
+        while True:
+            try:
+                rv, end = DECODER.raw_decode(self.buffer, self.idx)
+            except json.JSONDecodeError as e:
+                if self.truncated(e) and self.read():
+                    continue
+                raise self.error(e.msg, e.pos) from None
+            if (end == len(self.buffer) or self.buffer[end] in NUMBER) \
+                    and self.read():
+                continue
+            self.idx = end
+            return rv
+
+    def rest(self):
+        """Decodes everything left in the stream as a single JSON value.
+
+        """
+        return json.loads(self.buffer[self.idx:] + self.stream.read())
+
+
+def iter_array(stream: IO, chunk_size: int = 65536):
+    """A generator over the elements of a JSON array in a text stream.
+
+    Parameters
+    ----------
+    stream : :obj:`IO`
+        The text stream containing the array.
+
+    chunk_size : :obj:`int`
+        The number of characters read from `stream` at a time.
+
+    Yields
+    ------
+    :obj:`Any`
+        The decoded elements, in order.
+
+    Raises
+    ------
+    :class:`~.SettingTypeError`
+        If the stream does not contain a JSON array.
+
+    :obj:`json.JSONDecodeError`
+        If the stream is not valid JSON.
+
+    """
+    reader = Reader(stream, chunk_size)
+    if reader.peek() != "[":
+        raise js.SettingTypeError(list, type(reader.rest()))
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def iter_object(stream: IO, chunk_size: int = 65536):
+    """A generator over the key/value pairs of a JSON object in a text
+    stream.
+
+    Parameters
+    ----------
+    stream : :obj:`IO`
+        The text stream containing the object.
+
+    chunk_size : :obj:`int`
+        The number of characters read from `stream` at a time.
+
+    Yields
+    ------
+    :obj:`tuple`[:obj:`str`, :obj:`Any`]
+        The keys and decoded values, in order.
+
+    Raises
+    ------
+    :class:`~.SettingTypeError`
+        If the stream does not contain a JSON object.
+
+    :obj:`json.JSONDecodeError`
+        If the stream is not valid JSON.
+
+    """
+    reader = Reader(stream, chunk_size)
+    if reader.peek() != "{":
+        raise js.SettingTypeError(dict, type(reader.rest()))
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+    while True:
+        if reader.peek() != '"':
+            reader.expect('"')
+        key = reader.value()
+        reader.expect(":")
+        yield key, reader.value()
+        if reader.expect(",}") == "}":
+            return
@@ -13,9 +13,9 @@ class TerminusSetting(ABC):
     derived class.
 
     If the expected type of a :class:`~.Settings` derived class attribute
-    inherits from :class:`Termninus`, then when __getattribute__ is called to
-    access the :class:`Terminus` instance, it will return the :attr:`value`
-    attribute instead.
+    inherits from :class:`Termninus`, then the attribute is assigned the
+    :attr:`value` attribute of the :class:`Terminus` instance, which is kept
+    in the `__nodes__` attribute of the :class:`~.Settings` instance.
 
     This structure allows for value checks to be applied to individual
     settings, on instantiation of :class:`~.Settings` derived classes.
@@ -40,6 +40,12 @@ class TerminusSetting(ABC):
     def get(self):
         return self.value
 
+    def _source(self):
+        """The value the instance was built from.
+
+        """
+        return self.value
+
     @staticmethod
     def assign(method):
         """A decorator that applies the :meth:`Terminus.distribute` to
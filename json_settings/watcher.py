@@ -0,0 +1,229 @@
+import json
+import os
+import threading
+
+from typing import Callable
+from typing import List
+from typing import Type
+
+import json_settings as js
+
+
+def changed_addresses(setting, old, new) -> List[list]:
+    """Finds the addresses, relative to a settings object, at which two
+    sources of it differ.
+
+    The sources are only descended into along nested settings objects whose
+    structure is unchanged. If a key is added, removed or unknown to the
+    schema, or a list changes length, the containing object is replaced as a
+    whole, which is signalled by the empty address.
+
+    Parameters
+    ----------
+    setting : :class:`~.Settings`
+        The settings object built from `old`.
+
+    old : :obj:`Union`[:obj:`dict`, :obj:`list`]
+        The values `setting` was built from.
+
+    new : :obj:`Union`[:obj:`dict`, :obj:`list`]
+        The new values.
+
+    Returns
+    -------
+    :obj:`List`[:obj:`list`]
+        The addresses of the changed values, in the form accepted by
+        :meth:`Settings.branch`.
+
+    """
+    if isinstance(setting, js.ListSetting):
+        if not isinstance(new, list) or len(old) != len(new):
+            return [[]]
+        keys = range(len(new))
+    elif isinstance(setting, js.DictionarySetting):
+        if not isinstance(new, dict) or old.keys() != new.keys():
+            return [[]]
+        keys = new.keys()
+    else:
+        fields = type(setting).__schema__.fields
+        if not isinstance(new, dict) or old.keys() != new.keys() or \
+                not new.keys() <= fields.keys():
+            return [[]]
+        keys = new.keys()
+    rv = list()
+    for key in keys:
+        if old[key] == new[key]:
+            continue
+        try:
+            node = setting.node(key)
+        except (KeyError, IndexError):
+            node = None
+        if not isinstance(node, js.Settings):
+            rv.append([key])
+            continue
+        rv.extend([key, *address]
+                  for address in changed_addresses(node, old[key], new[key]))
+    return rv
+
+
+class SettingsWatcher:
+    """Keeps a settings object in sync with the JSON file it is read from.
+
+    The file is polled for changes in its modification time and size. When it
+    changes, only the values that differ from the previous contents are
+    checked again, with :meth:`Settings.branch`, and every unchanged settings
+    object is shared with the previous root.
+
+    Attributes
+    ----------
+    path : :obj:`str`
+        The real path of the watched file.
+
+    setting_type : :obj:`Type`[:class:`~.Settings`]
+        The class the file is validated against.
+
+    callback : :obj:`Callable`
+        Called with each new root after the file has changed.
+
+    error_callback : :obj:`Callable`
+        Called with the exception raised by a failed reload in the background
+        thread. The previous root is kept.
+
+    interval : :obj:`float`
+        The number of seconds between polls of the background thread.
+
+    setting : :class:`~.Settings`
+        The current root, or None if the file has not been read yet.
+
+    """
+
+    def __init__(self,
+                 path: str,
+                 setting_type: Type[js.Settings],
+                 callback: Callable = None,
+                 error_callback: Callable = None,
+                 interval: float = 1.0):
+        """The constructor for the :class:`SettingsWatcher` class.
+
+        Parameters
+        ----------
+        path : :obj:`str`
+            The path of the JSON file to be watched.
+
+        setting_type : :obj:`Type`[:class:`~.Settings`]
+            The class the file is validated against.
+
+        callback : :obj:`Callable`
+            Called with each new root after the file has changed.
+
+        error_callback : :obj:`Callable`
+            Called with the exception raised by a failed reload in the
+            background thread.
+
+        interval : :obj:`float`
+            The number of seconds between polls of the background thread.
+
+        """
+        self.path = os.path.realpath(path)
+        self.setting_type = setting_type
+        self.callback = callback
+        self.error_callback = error_callback
+        self.interval = interval
+        self.setting = None
+        self.stamp = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def poll(self) -> bool:
+        """Reloads the file if it has changed since it was last read.
+
+        Returns
+        -------
+        :obj:`bool`
+            True if the file had changed and a new root was published.
+
+        Raises
+        ------
+        :obj:`json.JSONDecodeError`
+            If the file is not valid JSON.
+
+        :class:`~.SettingErrorMessage`
+            If the new values fail their checks. The previous root is kept,
+            and the file is read again on the next poll.
+
+        """
+        stat = os.stat(self.path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self.stamp:
+            return False
+        with open(self.path, 'r') as f:
+            self.reload(json.load(f))
+        self.stamp = stamp
+        return True
+
+    def reload(self, values: dict):
+        """Replaces the current root with one built from `values`, and
+        publishes it through :attr:`callback`.
+
+        Parameters
+        ----------
+        values : :obj:`dict`
+            The new values of the root.
+
+        Returns
+        -------
+        :class:`~.Settings`
+            The new root.
+
+        """
+        if self.setting is None:
+            rv = self.setting_type(values)
+        else:
+            addresses = changed_addresses(self.setting,
+                                          self.setting._source(),
+                                          values)
+            if [] in addresses:
+                rv = self.setting_type(values)
+            else:
+                rv = self.setting.branch(addresses, values)
+        self.setting = rv
+        if self.callback is not None:
+            self.callback(rv)
+        return rv
+
+    def run(self):
+        """Polls the file every :attr:`interval` seconds until :meth:`stop`
+        is called.
+
+        """
+        while not self.stopped.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                if self.error_callback is not None:
+                    self.error_callback(e)
+            self.stopped.wait(self.interval)
+
+    def start(self):
+        """Polls the file in a background daemon thread.
+
+        """
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stops the background thread and waits for it to finish.
+
+        """
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
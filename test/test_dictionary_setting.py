@@ -1,3 +1,5 @@
+import io
+import json
 import unittest
 
 from json_settings import DictionarySetting
@@ -67,3 +69,30 @@ class TestDictionarySetting(unittest.TestCase):
             setting["first"][1]
         self.assertIsInstance(setting["first"], IntDictionary)
         self.assertIsInstance(setting["second"], IntDictionary)
+
+    def test_update(self):
+        setting = DictionaryIntDictionary({"first": {"a": 1},
+                                           "second": {"b": 2}})
+        second = setting["second"]
+        self.assertIs(setting.update({"first": {"a": 3}}), setting)
+        self.assertEqual(setting["first"]["a"], 3)
+        self.assertIs(setting["second"], second)
+        setting.update({"third": {"c": 4}})
+        self.assertEqual(setting._source(), {"first": {"a": 3},
+                                             "second": {"b": 2},
+                                             "third": {"c": 4}})
+
+    def test_stream(self):
+        values = {f"key {i}": {"a": i, "b": -i} for i in range(10)}
+        text = json.dumps(values)
+        for chunk_size in [1, 5, 65536]:
+            streamed = list(DictionaryIntDictionary.stream(io.StringIO(text),
+                                                           chunk_size))
+            self.assertEqual([k for k, v in streamed], list(values))
+            self.assertEqual(streamed[4][1]["b"], -4)
+        values["key 2"]["a"] = 1.0
+        with self.assertRaises(SettingErrorMessage) as context:
+            list(DictionaryIntDictionary.stream(io.StringIO(json.dumps(values))))
+        self.assertEqual(context.exception.route, ["key 2", "a"])
+        with self.assertRaises(SettingTypeError):
+            list(IntDictionary.stream(io.StringIO("[1]")))
@@ -1,6 +1,12 @@
+import io
+import json
 import unittest
 
+from numpy import ndarray
+
 from json_settings import ListSetting
+from json_settings import Settings
+from json_settings import iter_array
 
 from json_settings import TypeAttributeNotImplementedError
 from json_settings import TypeAttributeTypeError 
@@ -23,12 +29,49 @@ class IntList(ListSetting):
     def __init__(self, values):
         self.type = int
 
+class SizedList(ListSetting):
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = int
+        self.size = len(values)
+
+class PackedFloatList(ListSetting):
+    packed = True
+
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = float
+
+class PackedIntList(ListSetting):
+    packed = True
+
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = int
+
+class Table(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.lookup = PackedFloatList
+
 class ListIntList(ListSetting):
     @ListSetting.assign
     def __init__(self, values):
         self.type = IntList
 
 
+class Record(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.name = str
+        self.values = IntList
+
+class RecordList(ListSetting):
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = Record
+
+
 class TestListSetting(unittest.TestCase):
 
     def test_type_attribute_not_implemented_error(self):
@@ -60,5 +103,104 @@ class TestListSetting(unittest.TestCase):
         with self.assertRaises(IndexError) as context:
             setting[1][3]
         self.assertIsInstance(setting[0], IntList)
-        
-        
+
+    def test_stream(self):
+        records = [
+            {"name": f"record {i}", "values": list(range(i))}
+            for i in range(20)
+        ]
+        text = json.dumps(records, indent=2)
+        for chunk_size in [1, 7, 65536]:
+            streamed = list(RecordList.stream(io.StringIO(text), chunk_size))
+            self.assertEqual([r.name for r in streamed],
+                             [r["name"] for r in records])
+            self.assertEqual(streamed[5].values, [0, 1, 2, 3, 4])
+        self.assertEqual(list(IntList.stream(io.StringIO(" [ ] "))), [])
+        self.assertEqual(
+            list(IntList.stream(io.StringIO("[12345, 6]"), 2)), [12345, 6])
+        records[3]["values"] = [1, "2"]
+        with self.assertRaises(SettingErrorMessage) as context:
+            list(RecordList.stream(io.StringIO(json.dumps(records)), 16))
+        self.assertEqual(context.exception.route, ["[3]", "values"])
+        self.assertTrue(str(context.exception).startswith("[3] -> values"))
+        with self.assertRaises(SettingTypeError):
+            list(IntList.stream(io.StringIO('{"a": 1}')))
+        with self.assertRaises(json.JSONDecodeError):
+            list(IntList.stream(io.StringIO("[1, 2")))
+
+    def test_stream_split_numbers(self):
+        text = "[1.25, 3e5, 7.5e-3]"
+        for chunk_size in range(1, len(text) + 1):
+            self.assertEqual(list(iter_array(io.StringIO(text), chunk_size)),
+                             [1.25, 3e5, 7.5e-3])
+        values = ["a\u00e9\"", True, False, None, -1, {"b": [1, "c"]}]
+        text = json.dumps(values, ensure_ascii=True)
+        for chunk_size in range(1, len(text) + 1):
+            self.assertEqual(list(iter_array(io.StringIO(text), chunk_size)),
+                             values)
+
+    def test_stream_malformed(self):
+        text = '[1,\n {"a" 2},' + ', '.join(["1"] * 100000) + "]"
+        stream = io.StringIO(text)
+        with self.assertRaises(json.JSONDecodeError) as context:
+            list(iter_array(stream, 16))
+        self.assertLessEqual(stream.tell(), 32)
+        self.assertEqual(context.exception.pos, text.index("2"))
+        self.assertEqual((context.exception.lineno,
+                          context.exception.colno), (2, 7))
+        self.assertIn("line 2 column 7", str(context.exception))
+
+    def test_validate(self):
+        setting, errors = RecordList.validate([
+            {"name": "a", "values": [1, "2", 3.0]},
+            {"name": 1, "values": []},
+            {"name": "c", "values": [1]}
+        ])
+        self.assertIsNone(setting)
+        self.assertEqual([e.route for e in errors],
+                         [["[0]", "values", "[1]"],
+                          ["[0]", "values", "[2]"],
+                          ["[1]", "name"]])
+        self.assertTrue(str(errors[0]).startswith("[0] -> values[1] -> "))
+
+    def test_packed(self):
+        setting = PackedFloatList([0.5, 1.5, 2.5])
+        self.assertIsInstance(setting.value, ndarray)
+        self.assertEqual(setting.value.dtype.name, "float64")
+        self.assertEqual(setting[1], 1.5)
+        self.assertIs(type(setting[1]), float)
+        self.assertEqual(setting[1:].tolist(), [1.5, 2.5])
+        self.assertEqual(setting._source(), [0.5, 1.5, 2.5])
+        view = setting.get
+        self.assertIs(view.base, setting.value)
+        with self.assertRaises(ValueError):
+            view[0] = 1.0
+        table = Table({"lookup": [1.0, 2.0]})
+        self.assertEqual(table.lookup.tolist(), [1.0, 2.0])
+        self.assertFalse(table.lookup.flags.writeable)
+        branch = table.branch([["lookup", 1]], {"lookup": [1.0, 3.0]})
+        self.assertEqual(branch.lookup.tolist(), [1.0, 3.0])
+        self.assertEqual(table.lookup.tolist(), [1.0, 2.0])
+        with self.assertRaises(SettingTypeError):
+            PackedFloatList([0.5, 1])
+        self.assertEqual(PackedIntList([1, 2]).value.dtype.name, "int64")
+        self.assertEqual(PackedIntList([True, 2]).value, [True, 2])
+        self.assertEqual(PackedIntList([2 ** 64]).value, [2 ** 64])
+        self.assertEqual(PackedIntList([]).value.tolist(), [])
+
+    def test_non_type_attributes(self):
+        self.assertEqual(SizedList([1, 2]).size, 2)
+        self.assertEqual(SizedList([1, 2, 3]).size, 3)
+        self.assertFalse(SizedList.__schema__.static)
+        IntList([1])
+        self.assertTrue(IntList.__schema__.static)
+
+    def test_update(self):
+        setting = RecordList([{"name": "a", "values": [1]}])
+        self.assertIs(setting.update([{"name": "b", "values": []}]), setting)
+        self.assertEqual(setting[0].name, "b")
+        setting.update([{"name": "c", "values": [2]}])
+        self.assertEqual(setting._source(), [{"name": "c", "values": [2]}])
+        with self.assertRaises(SettingErrorMessage):
+            setting.update([{"name": "d", "values": ["3"]}])
+        self.assertEqual(setting[0].name, "c")
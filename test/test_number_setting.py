@@ -1,6 +1,7 @@
 import unittest
 
 from json_settings import NumberSetting
+from json_settings import Range
 
 from json_settings import SettingErrorMessage
 from json_settings import SettingTypeError
@@ -68,6 +69,16 @@ class ExclusiveBound(NumberSetting):
         self.upper_bound_exclusive(10)
 
 
+class Interval(NumberSetting):
+    @NumberSetting.assign
+    def __init__(self, value):
+        self.type = float
+
+    def check(self):
+        self.in_interval(0.0, 1.0, upper_inclusive=False)
+        self.finite()
+
+
 class TestNumberSetting(unittest.TestCase):
     """The unit tests for the :class:`~.NumberSetting` class.
     
@@ -191,3 +202,48 @@ class TestNumberSetting(unittest.TestCase):
             ExclusiveBound({"min": 10, "max": 5, "num": 5}) 
     
 
+
+    def test_first_failing_index(self):
+        with self.assertRaises(SettingCheckError) as context:
+            Bound({"array": [1, 2, 11, 12]})
+        self.assertEqual(str(context.exception.raised_exception),
+                         "must be <= 10, found 11 at index 2")
+        setting = Bound({"array": [0, 10]})
+        self.assertEqual(setting.array.tolist(), [0, 10])
+        self.assertIs(setting.array, setting.array)
+
+    def test_in_interval(self):
+        self.assertEqual(Interval(0.0).value, 0.0)
+        self.assertEqual(Interval({"min": 0.0, "max": 0.5, "num": 3}).value,
+                         [0.0, 0.25, 0.5])
+        with self.assertRaises(SettingCheckError) as context:
+            Interval(1.0)
+        self.assertEqual(str(context.exception.raised_exception),
+                         "must be in [0.0, 1.0)")
+        with self.assertRaises(SettingCheckError) as context:
+            Interval({"array": [0.5, -0.5]})
+        self.assertEqual(str(context.exception.raised_exception),
+                         "must be in [0.0, 1.0), found -0.5 at index 1")
+
+    def test_finite(self):
+        with self.assertRaises(SettingCheckError) as context:
+            Interval({"array": [0.5, float("nan")]})
+        self.assertEqual(str(context.exception.raised_exception),
+                         "must be finite, found nan at index 1")
+
+    def test_lazy_range(self):
+        setting = Float({"min": 0.0, "max": 1.0, "num": 10 ** 12 + 1})
+        self.assertIsInstance(setting.value, Range)
+        self.assertEqual(len(setting.value), 10 ** 12 + 1)
+        self.assertEqual(setting.value[-1], 1.0)
+        self.assertEqual(setting._source(),
+                         {"min": 0.0, "max": 1.0, "num": 10 ** 12 + 1})
+        with self.assertRaises(SettingCheckError) as context:
+            Interval({"min": 0.0, "max": 2.0, "num": 2 * 10 ** 12 + 1})
+        self.assertEqual(str(context.exception.raised_exception),
+                         "must be in [0.0, 1.0), found 1.0 at index "
+                         "1000000000000")
+        with self.assertRaises(SettingCheckError) as context:
+            Bound({"min": 991, "max": 5, "num": 5})
+        self.assertEqual(str(context.exception.raised_exception),
+                         "must be <= 10, found 991 at index 0")
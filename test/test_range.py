@@ -0,0 +1,98 @@
+import pickle
+import unittest
+
+from numpy import asarray
+from numpy import linspace
+
+from json_settings import Range
+from json_settings import Zipped
+
+
+class TestRange(unittest.TestCase):
+    """The unit tests for the :class:`~.Range` class.
+
+    """
+
+    def test_matches_linspace(self):
+        for minimum, maximum, num in [(0.0, 1.0, 3), (0.1, 0.7, 7),
+                                      (-3.3, 12.9, 1001), (5.0, -2.0, 9),
+                                      (1.0, 1.0, 4), (2.0, 3.0, 1),
+                                      (0.0, 1.0, 0)]:
+            expected = [float(i) for i in linspace(minimum, maximum, num)]
+            setting = Range(minimum, maximum, num, float)
+            self.assertEqual(list(setting), expected)
+            self.assertEqual(setting, expected)
+            self.assertEqual(asarray(setting).tolist(), expected)
+        expected = [int(i) for i in linspace(0, 10, 7)]
+        self.assertEqual(list(Range(0, 10, 7, int)), expected)
+
+    def test_sequence(self):
+        setting = Range(0.0, 1.0, 5, float)
+        self.assertEqual(len(setting), 5)
+        self.assertEqual(setting[1], 0.25)
+        self.assertEqual(setting[-1], 1.0)
+        self.assertEqual(setting[1:3], [0.25, 0.5])
+        self.assertIsInstance(setting[1:3], Range)
+        self.assertEqual(setting[::-2], [1.0, 0.5, 0.0])
+        self.assertEqual(setting[::-2][1:], [0.5, 0.0])
+        self.assertEqual(asarray(setting[::-2]).tolist(), [1.0, 0.5, 0.0])
+        self.assertEqual(setting[4:], [1.0])
+        with self.assertRaises(IndexError):
+            setting[5]
+        self.assertEqual(setting.index(0.75), 3)
+        self.assertIn(0.5, setting)
+        self.assertNotIn(0.6, setting)
+        self.assertNotIn("a", setting)
+        self.assertEqual(Range(1.0, 0.0, 5, float).index(0.25), 3)
+        self.assertEqual(Range(0, 3, 7, int).index(1), 2)
+        self.assertEqual(pickle.loads(pickle.dumps(setting)), setting)
+
+    def test_index(self):
+        setting = Range(0, 3, 7, int)
+        self.assertEqual([setting.index(i) for i in range(4)], [0, 2, 4, 6])
+        self.assertEqual(setting.index(1, 3), 3)
+        self.assertEqual(setting.index(2, 0, 5), 4)
+        with self.assertRaises(ValueError):
+            setting.index(3, 0, 6)
+        with self.assertRaises(ValueError):
+            setting.index(None)
+        descending = Range(1.0, 0.0, 5, float)
+        self.assertEqual([descending.index(i) for i in descending],
+                         list(range(5)))
+        with self.assertRaises(ValueError):
+            descending.index(2.0)
+        with self.assertRaises(TypeError):
+            setting.index()
+
+    def test_zipped(self):
+        first = Range(0.0, 1.0, 5, float)
+        second = Range(0, 8, 5, int)
+        setting = Zipped([first, second, [5, 6, 7]])
+        self.assertEqual(len(setting), 3)
+        self.assertEqual(list(setting), [(0.0, 0, 5), (0.25, 2, 6),
+                                         (0.5, 4, 7)])
+        self.assertEqual(setting[-1], (0.5, 4, 7))
+        self.assertEqual(setting[::-1], [(0.5, 4, 7), (0.25, 2, 6),
+                                         (0.0, 0, 5)])
+        self.assertIsInstance(setting[1:].columns[0], Range)
+        self.assertEqual(asarray(setting).shape, (3, 3))
+        self.assertEqual(setting.index((0.25, 2, 6)), 1)
+        with self.assertRaises(ValueError):
+            setting.index((0.25, 2, 7))
+        with self.assertRaises(ValueError):
+            setting.index(1)
+        repeated = Zipped([Range(0, 3, 7, int), range(7)])
+        self.assertEqual(repeated.index((1, 3)), 3)
+
+    def test_huge(self):
+        setting = Range(0.0, 1.0, 10 ** 15 + 1, float)
+        self.assertEqual(len(setting), 10 ** 15 + 1)
+        self.assertEqual(setting[10 ** 14], 0.1)
+        self.assertEqual(setting.index(0.5), 5 * 10 ** 14)
+        self.assertEqual(setting.first(lambda item: item > 0.5),
+                         5 * 10 ** 14 + 1)
+        self.assertIsNone(setting.first(lambda item: item > 1.0))
+        half = setting[5 * 10 ** 14:]
+        self.assertEqual(len(half), 5 * 10 ** 14 + 1)
+        self.assertEqual(half[0], 0.5)
+        self.assertEqual(half.index(1.0), 5 * 10 ** 14)
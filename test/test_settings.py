@@ -1,4 +1,26 @@
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+
+from copy import copy
+
+from decimal import Decimal
+
+from hashlib import blake2b
+
+from json_settings import schema
+from json_settings import settings
 from json_settings.settings import Settings
+from json_settings import fingerprint
+from json_settings import ListSetting
+from json_settings import NumberSetting
+from json_settings import register_primitive
+from json_settings import TerminusSetting
+from json_settings import ConsistencyError
 from json_settings import SettingErrorMessage
 from json_settings import SettingTypeError
 from json_settings import SettingNotFoundError
@@ -17,6 +39,155 @@ class SettingOfSetting(Settings):
         self.item = SingleSetting
 
 
+class CountingSetting(Settings):
+    calls = 0
+
+    @Settings.assign
+    def __init__(self, values):
+        CountingSetting.calls += 1
+        self.item = int
+        self.name = str
+
+
+class DecimalSetting(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.item = Decimal
+
+
+class Name(TerminusSetting):
+    @TerminusSetting.assign
+    def __init__(self, value):
+        self.type = str
+
+    def check(self):
+        pass
+
+
+class NamedSetting(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.name = Name
+        self.item = SingleSetting
+
+
+class SourceSetting(Settings):
+    compact = True
+
+    @Settings.assign
+    def __init__(self, values):
+        self.source = Name
+        self.fingerprint = Name
+        self.item = SingleSetting
+
+
+class LazySetting(Settings):
+    lazy = True
+
+    @Settings.assign
+    def __init__(self, values):
+        self.name = Name
+        self.first = SingleSetting
+        self.second = SingleSetting
+
+
+class SlowSetting(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.item = int
+
+    def consistency_check(self):
+        time.sleep(0.01)
+
+
+class LazySlowSetting(Settings):
+    lazy = True
+
+    @Settings.assign
+    def __init__(self, values):
+        self.item = SlowSetting
+
+
+class Bounds(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.low = int
+        self.high = int
+
+    def consistency_check(self):
+        if self.low > self.high:
+            raise ConsistencyError("low must be <= high")
+
+
+class BoundedSetting(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.bounds = Bounds
+        self.item = SingleSetting
+
+
+class Count(NumberSetting):
+    @NumberSetting.assign
+    def __init__(self, value):
+        self.type = int
+
+    def check(self):
+        self.lower_bound(0)
+
+
+class CompactRecord(Settings):
+    compact = True
+
+    @Settings.assign
+    def __init__(self, values):
+        self.name = Name
+        self.count = Count
+        self.item = SingleSetting
+        self.flag = bool
+
+
+class CompactRecordList(ListSetting):
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = CompactRecord
+
+
+class PlainRecord(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.name = Name
+        self.count = Count
+        self.item = SingleSetting
+        self.flag = bool
+
+
+class PlainRecordList(ListSetting):
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = PlainRecord
+
+
+class CompactHolder(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.record = CompactRecord
+        self.records = CompactRecordList
+
+
+def footprint(setting) -> int:
+    """The bytes held by a settings object, its instance dictionary and the
+    nodes of its own attributes, but not those of nested settings objects.
+
+    """
+    rv = sys.getsizeof(setting) + sys.getsizeof(setting.__dict__)
+    if "__source__" in setting.__dict__:
+        rv += sys.getsizeof(setting.__source__)
+    for node in setting.__nodes__.values():
+        if not isinstance(node, Settings):
+            rv += sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+    return rv
+
+
 class TestSettings(unittest.TestCase):
     """The unit tests for the :class:`~.Settings` class.
     
@@ -40,4 +211,276 @@ class TestSettings(unittest.TestCase):
     def test_subsetting_not_a_dict(self):
         pass
 
-   
\ No newline at end of file
+    def test_schema_compiled_once(self):
+        first = CountingSetting({"item": 1, "name": "a"})
+        second = CountingSetting({"item": 2, "name": "b"})
+        self.assertEqual(CountingSetting.calls, 1)
+        self.assertEqual(list(CountingSetting.__schema__.fields),
+                         ["item", "name"])
+        SettingOfSetting({"item": {"item": 1}})
+        self.assertIsNot(SettingOfSetting.__schema__,
+                         SingleSetting.__schema__)
+        self.assertEqual(first.item, 1)
+        self.assertEqual(second.item, 2)
+        self.assertEqual(second.name, "b")
+
+    @staticmethod
+    def restore_primitive(types):
+        schema.PRIMITIVE_TYPES = types
+        register_primitive()
+
+    def test_register_primitive(self):
+        self.assertIn(int, SingleSetting({"item": 1}).primitive)
+        with self.assertRaises(TypeError):
+            register_primitive(1.0)
+        self.addCleanup(self.restore_primitive, schema.PRIMITIVE_TYPES)
+        register_primitive(Decimal)
+        setting = DecimalSetting({"item": Decimal("1.5")})
+        self.assertEqual(setting.item, Decimal("1.5"))
+        with self.assertRaises(SettingErrorMessage):
+            DecimalSetting({"item": 1.5})
+        self.restore_primitive(schema.PRIMITIVE_TYPES - {Decimal})
+        DecimalSetting({"item": Decimal("1.5")})
+        self.assertFalse(DecimalSetting.__schema__.fields["item"].primitive)
+
+    def test_unwrapped_attributes(self):
+        setting = NamedSetting({"name": "a", "item": {"item": 1}})
+        self.assertEqual(setting.__dict__["name"], "a")
+        self.assertIsInstance(setting.__nodes__["name"], Name)
+        self.assertIsInstance(setting.item, SingleSetting)
+        self.assertIs(setting.__nodes__["item"], setting.item)
+        self.assertFalse(NamedSetting.__schema__.fields["item"].unwrap)
+        self.assertTrue(NamedSetting.__schema__.fields["name"].unwrap)
+
+    def test_fingerprint(self):
+        first = NamedSetting({"name": "a", "item": {"item": 1}})
+        second = NamedSetting({"item": {"item": 1}, "name": "a"})
+        third = NamedSetting({"name": "b", "item": {"item": 1}})
+        self.assertEqual(fingerprint(first), fingerprint(second))
+        self.assertEqual(len(fingerprint(first)), 32)
+        self.assertIs(fingerprint(first), fingerprint(first))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, third)
+        self.assertNotEqual(first, 1)
+        self.assertEqual(
+            fingerprint(first),
+            blake2b(b'{"item":{"item":1},"name":"a"}',
+                    digest_size=16).hexdigest())
+
+    def test_reserved_field_names(self):
+        values = {"source": "a", "fingerprint": "b", "item": {"item": 1}}
+        setting = SourceSetting(values)
+        self.assertEqual(setting.source, "a")
+        self.assertEqual(setting.fingerprint, "b")
+        self.assertEqual(setting._source(), values)
+        self.assertEqual(setting, SourceSetting(dict(values)))
+        self.assertEqual(hash(setting), hash(SourceSetting(dict(values))))
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+            with open(path, "w") as f:
+                json.dump({"item": 1}, f)
+            setting = SingleSetting.from_file(path)
+            self.assertEqual(setting.item, 1)
+            setting.item = 2
+            cached = SingleSetting.from_file(path)
+            self.assertIsNot(cached, setting)
+            self.assertEqual(cached.item, 1)
+            with open(path, "w") as f:
+                json.dump({"item": 10}, f)
+            first, second = SingleSetting.from_files([path, path])
+            self.assertEqual(first.item, 10)
+            self.assertEqual(first, second)
+
+    def test_from_file_cache_size(self):
+        self.addCleanup(setattr, settings, "FILE_CACHE_SIZE",
+                        settings.FILE_CACHE_SIZE)
+        settings.FILE_CACHE_SIZE = 2
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"{idx}.json")
+                     for idx in range(3)]
+            for idx, path in enumerate(paths):
+                with open(path, "w") as f:
+                    json.dump({"item": idx}, f)
+            SingleSetting.from_files(paths)
+            keys = [key for key in settings.FILE_CACHE
+                    if key[1] in map(os.path.realpath, paths)]
+            self.assertEqual([key[1] for key in keys],
+                             [os.path.realpath(path) for path in paths[1:]])
+
+    def test_lazy(self):
+        values = {"name": "a", "first": {"item": 1}, "second": {"item": "2"}}
+        setting = LazySetting(values)
+        self.assertEqual(setting.name, "a")
+        self.assertNotIn("first", setting.__dict__)
+        self.assertEqual(setting.first.item, 1)
+        self.assertIn("first", setting.__dict__)
+        with self.assertRaises(SettingErrorMessage) as context:
+            setting.second
+        self.assertEqual(context.exception.route, ["second", "item"])
+        with self.assertRaises(SettingErrorMessage):
+            LazySetting(values).validate_all()
+        with self.assertRaises(AttributeError):
+            setting.third
+        values["second"]["item"] = 2
+        setting = LazySetting(values).validate_all()
+        self.assertEqual(setting.__pending__, {})
+        self.assertEqual(setting.second.item, 2)
+
+    def test_lazy_threads(self):
+        setting = LazySlowSetting({"item": {"item": 1}})
+        barrier = threading.Barrier(8)
+        results, errors = list(), list()
+
+        def read():
+            barrier.wait()
+            try:
+                results.append(setting.item)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(item is results[0] for item in results))
+        self.assertEqual(setting.__pending__, {})
+
+    def test_lazy_pickle(self):
+        values = {"name": "a", "first": {"item": 1}, "second": {"item": 2}}
+        setting = pickle.loads(pickle.dumps(LazySetting(values)))
+        self.assertIn("first", setting.__pending__)
+        self.assertEqual(setting.first.item, 1)
+        self.assertEqual(copy(setting).second.item, 2)
+
+    def test_validate(self):
+        setting, errors = NamedSetting.validate(
+            {"name": "a", "item": {"item": 1}})
+        self.assertEqual(errors, [])
+        self.assertEqual(setting.item.item, 1)
+        setting, errors = NamedSetting.validate({"name": 1, "item": {}})
+        self.assertIsNone(setting)
+        self.assertEqual([e.route for e in errors],
+                         [["name"], ["item", "item"]])
+        self.assertIsInstance(errors[0].original_error, SettingTypeError)
+        self.assertIsInstance(errors[1].original_error, SettingNotFoundError)
+        self.assertEqual(str(errors[1]), "item -> item -> Setting not found.")
+        setting, errors = LazySetting.validate(
+            {"name": "a", "first": {"item": "1"}})
+        self.assertEqual([e.route for e in errors],
+                         [["first", "item"], ["second"]])
+        setting, errors = SingleSetting.validate(1)
+        self.assertEqual([e.route for e in errors], [["SingleSetting"]])
+
+    def test_error_route(self):
+        with self.assertRaises(SettingErrorMessage) as context:
+            SettingOfSetting({"item": {"item": "1"}})
+        self.assertEqual(context.exception.route, ["item", "item"])
+        self.assertEqual(str(context.exception).split(" -> ")[:2],
+                         ["item", "item"])
+        self.assertEqual(context.exception.args, (str(context.exception),))
+        self.assertIn("item -> item", repr(context.exception))
+        copy = pickle.loads(pickle.dumps(context.exception))
+        self.assertEqual(copy.args, context.exception.args)
+
+    def test_validate_many(self):
+        documents = [{"name": "a", "item": {"item": idx}} for idx in range(5)]
+        documents[2] = {"name": 1, "item": {}}
+        serial = NamedSetting.validate_many(documents)
+        parallel = NamedSetting.validate_many(documents,
+                                              workers=2,
+                                              chunk_size=2)
+        for results in (serial, parallel):
+            self.assertEqual(len(results), 5)
+            self.assertEqual([r.item.item for r in results if
+                              isinstance(r, NamedSetting)], [0, 1, 3, 4])
+            self.assertEqual([e.route for e in results[2]],
+                             [["name"], ["item", "item"]])
+            self.assertIsInstance(results[2][0].original_error,
+                                  SettingTypeError)
+            self.assertEqual(str(results[2][1]),
+                             "item -> item -> Setting not found.")
+        self.assertEqual(serial[0], parallel[0])
+
+    def test_compact_footprint(self):
+        records = [{"name": str(idx), "count": idx, "item": {"item": idx},
+                    "flag": True} for idx in range(100)]
+        compact = CompactRecordList(records)
+        plain = PlainRecordList(records)
+        for item in compact:
+            self.assertNotIn("__source__", item.__dict__)
+            self.assertEqual(list(item.__nodes__), ["item"])
+        self.assertLess(sum(map(footprint, compact)),
+                        sum(map(footprint, plain)) // 2)
+
+    def test_update(self):
+        values = {"bounds": {"low": 0, "high": 1}, "item": {"item": 1}}
+        setting = BoundedSetting(values)
+        bounds, item = setting.bounds, setting.item
+        digest = fingerprint(setting)
+        self.assertIs(setting.update({"bounds": {"high": 5}}), setting)
+        self.assertEqual(setting.bounds.high, 5)
+        self.assertIs(setting.item, item)
+        self.assertEqual(bounds.high, 1)
+        self.assertEqual(values["bounds"]["high"], 1)
+        self.assertEqual(setting.__source__,
+                         {"bounds": {"low": 0, "high": 5},
+                          "item": {"item": 1}})
+        self.assertEqual(setting.bounds.__source__, {"low": 0, "high": 5})
+        self.assertNotEqual(fingerprint(setting), digest)
+        self.assertEqual(setting, BoundedSetting(setting.__source__))
+        with self.assertRaises(SettingErrorMessage) as context:
+            setting.update({"bounds": {"low": 6}})
+        self.assertEqual(context.exception.route, ["bounds"])
+        with self.assertRaises(SettingErrorMessage) as context:
+            setting.update({"item": {"item": "2"}})
+        self.assertEqual(context.exception.route, ["item", "item"])
+        self.assertEqual(setting.bounds.low, 0)
+        self.assertIs(setting.item, item)
+        setting.update({"item": {"item": 2}, "other": 1})
+        self.assertEqual(setting.item.item, 2)
+        self.assertEqual(setting.__source__["other"], 1)
+
+    def test_compact(self):
+        record = {"name": "a",
+                  "count": 1,
+                  "item": {"item": 2},
+                  "flag": True}
+        values = {"record": record,
+                  "records": [record, dict(record, count={"array": [1, 2]})]}
+        setting = CompactHolder(values)
+        self.assertEqual(setting.record.name, "a")
+        self.assertEqual(setting.record.count, 1)
+        self.assertEqual(setting.records[1].count, [1, 2])
+        self.assertFalse(hasattr(setting.record, "__source__"))
+        self.assertFalse(hasattr(setting.records[0], "__source__"))
+        self.assertEqual(setting.record.__nodes__,
+                         {"item": setting.record.item})
+        self.assertIsInstance(setting.records[1].__nodes__["count"], Count)
+        self.assertEqual(setting.record.node("name").get, "a")
+        self.assertEqual(setting.record._source(), record)
+        self.assertEqual(setting.node("records")._source(), values["records"])
+        self.assertEqual(fingerprint(setting.record),
+                         fingerprint(CompactRecord(record)))
+        self.assertEqual(CompactRecord(record).__source__, record)
+        setting.update({"record": {"count": 3, "item": {"item": 4}}})
+        self.assertEqual(setting.record.count, 3)
+        self.assertEqual(setting.record.item.item, 4)
+        self.assertEqual(setting.record._source(),
+                         dict(record, count=3, item={"item": 4}))
+        item = setting.record.item
+        setting.record.update({"count": 4})
+        self.assertEqual(setting.record.count, 4)
+        self.assertIs(setting.record.item, item)
+        self.assertFalse(hasattr(setting.record, "__source__"))
+        setting.records[0].update({"name": "b", "other": 1})
+        self.assertEqual(setting.records[0].name, "b")
+        self.assertFalse(hasattr(setting.records[0], "__source__"))
+        with self.assertRaises(SettingErrorMessage) as context:
+            setting.update({"record": {"count": -1}})
+        self.assertEqual(context.exception.route, ["record", "count"])
@@ -1,8 +1,19 @@
+import json
+import os
+import pickle
+import tempfile
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import savez_compressed
+
 from json_settings import Space
 from json_settings import Settings
 from json_settings import NumberSetting
+from json_settings import Range
+from json_settings import ConsistencyError
+from json_settings import SettingErrorMessage
 
 
 class MainSettings(Settings):
@@ -51,6 +62,26 @@ class DepthTwo(Settings):
         self.dog = str
 
 
+class ConsistentSettings(Settings):
+
+    @Settings.assign
+    def __init__(self, values):
+        self.item = Ordered
+        self.object = DepthTwo
+
+
+class Ordered(Settings):
+
+    @Settings.assign
+    def __init__(self, values):
+        self.a = Float
+        self.b = Float
+
+    def consistency_check(self):
+        if isinstance(self.a, float) and self.a > self.b:
+            raise ConsistencyError("a must be <= b")
+
+
 class Float(NumberSetting):
 
     @NumberSetting.assign
@@ -274,3 +305,423 @@ class TestSpace(unittest.TestCase):
         self.assertEqual(space.shape, (3,))
         self.assertEqual(space[1].item.a, 2.0)
         self.assertEqual(space[1].object.a, array)
+
+    def test_lazy(self):
+        a = [1.0, 2.0, 3.0]
+        b = [4.0, 5.0]
+        c = [7.0, 8.0, 9.0, 10.0]
+        values = {
+            "a": {
+                "array": a
+            },
+            "b": {
+                "array": b
+            },
+            "c": {
+                "array": c
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s, lazy=True, cache=4)
+        self.assertEqual(space.space, [])
+        self.assertEqual(space.shape, (3, 2, 4))
+        self.assertEqual(len(space), 24)
+        self.assertIs(space[1, 1, 2], space[1, 1, 2])
+        self.assertEqual(space[1, 1, 2].c, 9.0)
+        eager = Space(s)
+        self.assertEqual(list(space), eager.space)
+        self.assertEqual(space.linear_index(eager[2, 0, 3]), 19)
+
+    def test_iter(self):
+        values = {
+            "a": {
+                "array": [1.0, 2.0, 3.0]
+            },
+            "b": {
+                "array": [4.0, 5.0]
+            },
+            "c": 7.0,
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s, lazy=True)
+        eager = Space(s)
+        self.assertEqual(list(space.iter()), eager.space)
+        self.assertEqual(list(space.iter(start=1, stop=4)), eager.space[1:4])
+        self.assertEqual(list(eager.iter(start=-2)), eager.space[-2:])
+        batches = list(space.iter(batch_size=4, start=1))
+        self.assertEqual([len(b) for b in batches], [4, 1])
+        self.assertEqual(batches[1][0].a, 3.0)
+        self.assertEqual(batches[1][0].b, 5.0)
+        with self.assertRaises(ValueError):
+            next(space.iter(batch_size=0))
+
+    def test_parallel(self):
+        values = {
+            "a": {
+                "array": [1.0, 2.0, 3.0]
+            },
+            "b": {
+                "array": [4.0, 5.0, 6.0, 7.0, 8.0],
+                "match": "f"
+            },
+            "c": {
+                "array": [9.0, 10.0, 11.0, 12.0, 13.0],
+                "match": "f"
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        serial = Space(s)
+        self.assertEqual(Space(s, workers=2).space, serial.space)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            threaded = Space(s, executor=executor)
+        self.assertEqual(threaded.space, serial.space)
+        self.assertEqual(threaded[2, 3].c, 12.0)
+
+    def test_points_share_unchanged_branches(self):
+        values = {
+            "item": {
+                "a": {
+                    "array": [1.0, 2.0, 3.0]
+                },
+                "b": 2.5
+            },
+            "object": {
+                "a": 1.0,
+                "dog": "terrier"
+            }
+        }
+
+        settings = ConsistentSettings(values)
+        space = Space(settings, lazy=True)
+        first = space[0]
+        self.assertIs(first.object, settings.object)
+        self.assertIs(first.item.__nodes__["b"], settings.item.__nodes__["b"])
+        self.assertIsNot(first.item, settings.item)
+        self.assertEqual(first.item.a, 1.0)
+        self.assertEqual(first.__source__["item"]["a"], 1.0)
+        self.assertIs(first.__source__["item"], first.item.__source__)
+        self.assertIs(first.__source__["object"],
+                      settings.__source__["object"])
+        self.assertEqual(settings.__source__["item"]["a"]["array"],
+                         [1.0, 2.0, 3.0])
+        self.assertEqual(space[1].item.a, 2.0)
+        with self.assertRaises(SettingErrorMessage) as context:
+            space[2]
+        self.assertEqual(context.exception.route, ["item"])
+        self.assertIsInstance(context.exception.original_error,
+                              ConsistencyError)
+
+    def test_index(self):
+        a = [1.0, 2.0, 3.0]
+        b = [4.0, 5.0]
+        c = [7.0, 8.0]
+        values = {
+            "a": {
+                "array": a
+            },
+            "b": {
+                "array": b,
+                "match": "f"
+            },
+            "c": {
+                "array": c,
+                "match": "f"
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s)
+        for idx, point in enumerate(space.space):
+            self.assertEqual(space.linear_index(point), idx)
+        self.assertEqual(tuple(space.index(space[2, 1])), (2, 1))
+        values["a"] = 1.5
+        values["b"] = 4.0
+        values["c"] = 7.0
+        with self.assertRaises(ValueError):
+            space.linear_index(MainSettings(values))
+        values["a"] = 1.0
+        values["c"] = 8.0
+        with self.assertRaises(ValueError):
+            space.linear_index(MainSettings(values))
+        values["c"] = 7.0
+        self.assertEqual(space.linear_index(MainSettings(values)), 0)
+
+    def test_grid(self):
+        values = {
+            "a": {
+                "array": [1.0, 2.0, 3.0]
+            },
+            "b": {
+                "array": [4.0, 5.0],
+                "match": "f"
+            },
+            "c": {
+                "array": [7.0, 8.0],
+                "match": "f"
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s, lazy=True)
+        grid = space.grid()
+        self.assertEqual(len(grid), len(space.addresses))
+        for address, array in zip(space.addresses, grid):
+            self.assertEqual(array.shape, space.shape)
+            for i in range(3):
+                for j in range(2):
+                    self.assertEqual(array[i, j],
+                                     getattr(space[i, j], address[0]))
+        self.assertEqual(Space(MainSettings({
+            "a": 1.0, "b": 2.0, "c": 3.0, "badger": "creature"
+        })).grid(), [])
+
+    def test_slicing(self):
+        a = [1.0, 2.0, 3.0]
+        b = [4.0, 5.0, 6.0, 7.0]
+        c = [8.0, 9.0]
+        values = {
+            "a": {
+                "array": a
+            },
+            "b": {
+                "array": b,
+                "match": "f"
+            },
+            "c": {
+                "array": c
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s)
+        self.assertEqual(space.shape, (3, 2, 4))
+        self.assertIs(space[-1, 0, -2], space[2, 0, 2])
+        view = space[0, :, 1:3]
+        self.assertEqual(view.shape, (2, 2))
+        self.assertEqual(len(view), 4)
+        self.assertEqual(view.space, [])
+        self.assertIs(view[1, 0], space[0, 1, 1])
+        self.assertEqual(list(view), [space[0, i, j]
+                                      for i in range(2)
+                                      for j in range(1, 3)])
+        self.assertEqual(space[..., -1].shape, (3, 2))
+        self.assertIs(space[..., -1][1, 1], space[1, 1, 3])
+        self.assertEqual(space[1].shape, (2, 4))
+        nested = space[:, ::-1][1:, 0]
+        self.assertIs(nested.parent, space)
+        self.assertEqual(nested.shape, (2, 4))
+        self.assertIs(nested[0, 2], space[1, 1, 2])
+        self.assertEqual(nested.linear_index(space[2, 1, 3]), 7)
+        with self.assertRaises(ValueError):
+            nested.linear_index(space[2, 0, 3])
+        grid = nested.grid()
+        self.assertEqual(grid[0][1, 0], 3.0)
+        self.assertEqual(grid[1][1, 3], 7.0)
+        with self.assertRaises(IndexError):
+            space[0, 0, 0, 0]
+        with self.assertRaises(IndexError):
+            space[..., ...]
+        with self.assertRaises(IndexError):
+            space[3]
+        with self.assertRaises(IndexError):
+            space["a"]
+        lazy = Space(s, lazy=True)
+        self.assertEqual(lazy[:, 1].iter(start=2).__next__(), space[0, 1, 2])
+
+    def test_shard(self):
+        values = {
+            "a": {
+                "array": [1.0, 2.0, 3.0]
+            },
+            "b": {
+                "array": [4.0, 5.0, 6.0, 7.0, 8.0]
+            },
+            "c": 9.0,
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s, lazy=True)
+        for strategy in ["block", "cyclic"]:
+            shards = [space.shard(i, 4, strategy) for i in range(4)]
+            self.assertEqual(sorted(i for shard in shards for i in shard),
+                             list(range(15)))
+        self.assertEqual(space.shard(0, 4), range(0, 4))
+        self.assertEqual(space.shard(3, 4), range(12, 15))
+        self.assertEqual(space.shard(1, 4, "cyclic"), range(1, 15, 4))
+        shard = space.shard(1, 4, "cyclic")
+        self.assertEqual(
+            list(space.iter(start=shard.start, stop=shard.stop,
+                            step=shard.step)),
+            [space.element(i) for i in shard])
+        with self.assertRaises(ValueError):
+            space.shard(4, 4)
+        with self.assertRaises(ValueError):
+            space.shard(0, 0)
+        with self.assertRaises(ValueError):
+            space.shard(0, 2, "random")
+
+    def test_save_load(self):
+        values = {
+            "a": {
+                "array": [1.0, 2.0, 3.0]
+            },
+            "b": {
+                "array": [4.0, 5.0],
+                "match": "f"
+            },
+            "c": {
+                "array": [7.0, 8.0],
+                "match": "f"
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "space.npz")
+            space.save(path)
+            loaded = Space.load(path, MainSettings)
+            self.assertEqual(loaded.shape, space.shape)
+            self.assertEqual(loaded.space, [])
+            self.assertEqual(list(loaded), space.space)
+            self.assertEqual(loaded.linear_index(space[2, 1]), 5)
+            space[:, 1].save(path)
+            loaded = Space.load(path, MainSettings)
+            self.assertEqual(loaded.shape, (3,))
+            self.assertEqual(list(loaded), [space[i, 1] for i in range(3)])
+
+    def test_load_rejects_other_types(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "space.npz")
+            manifest = {"setting": "os:system", "source": "echo",
+                        "restrict": None, "axes": [], "match": [],
+                        "shape": []}
+            savez_compressed(path, manifest=json.dumps(manifest))
+            with self.assertRaises(TypeError):
+                Space.load(path, os.system)
+            with self.assertRaises(TypeError):
+                Space.load(path, MainSettings)
+
+    def test_range_axis(self):
+        values = {
+            "a": {
+                "min": 0.0,
+                "max": 1.0,
+                "num": 10 ** 9 + 1
+            },
+            "b": {
+                "array": [4.0, 5.0]
+            },
+            "c": 7.0,
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        self.assertIsInstance(s.a, Range)
+        space = Space(s, lazy=True)
+        self.assertIs(space.values[0], s.a)
+        self.assertEqual(space.shape, (10 ** 9 + 1, 2))
+        point = space[5 * 10 ** 8, 1]
+        self.assertEqual(point.a, 0.5)
+        self.assertEqual(point.b, 5.0)
+        self.assertEqual(space.linear_index(point), 10 ** 9 + 1)
+        with self.assertRaises(ValueError):
+            space.linear_index(MainSettings(dict(values, a=2.0, b=4.0)))
+        view = space[10 ** 8:, 1]
+        self.assertIsInstance(view.values[0], Range)
+        self.assertEqual(view.shape, (9 * 10 ** 8 + 1,))
+        self.assertEqual(view[4 * 10 ** 8].a, 0.5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "space.npz")
+            space.save(path)
+            loaded = Space.load(path, MainSettings)
+            self.assertEqual(loaded.values[0], s.a)
+            self.assertEqual(loaded.linear_index(point), 10 ** 9 + 1)
+            view.save(path)
+            loaded = Space.load(path, MainSettings)
+            self.assertEqual(loaded.values[0], view.values[0])
+            self.assertEqual(loaded[4 * 10 ** 8], view[4 * 10 ** 8])
+
+    def test_matched_range_axis(self):
+        values = {
+            "a": {
+                "min": 0.0,
+                "max": 1.0,
+                "num": 10 ** 9 + 1,
+                "match": "f"
+            },
+            "b": {
+                "min": 1.0,
+                "max": 2.0,
+                "num": 10 ** 9 + 1,
+                "match": "f"
+            },
+            "c": {
+                "array": [7.0, 8.0]
+            },
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        space = Space(s, lazy=True)
+        self.assertEqual(space.shape, (2, 10 ** 9 + 1))
+        self.assertEqual(space.values[1].columns, [s.a, s.b])
+        point = space[1, 5 * 10 ** 8]
+        self.assertEqual((point.a, point.b, point.c), (0.5, 1.5, 8.0))
+        self.assertEqual(space.linear_index(point), 15 * 10 ** 8 + 1)
+        view = space[0, ::2]
+        self.assertEqual(view.values[0].columns[0], s.a[::2])
+        self.assertEqual(view[1].b, 1.0 + 2e-9)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "space.npz")
+            space.save(path)
+            loaded = Space.load(path, MainSettings)
+            self.assertEqual(loaded.values, space.values)
+            self.assertEqual(loaded.linear_index(point), 15 * 10 ** 8 + 1)
+
+    def test_range_axis_summary(self):
+        values = {
+            "a": {
+                "min": 0.0,
+                "max": 1.0,
+                "num": 3
+            },
+            "b": 4.0,
+            "c": 7.0,
+            "badger": "creature"
+        }
+
+        summary = Space(MainSettings(values), lazy=True).cout_summary()
+        self.assertIn("values:  [0.0, 0.5, 1.0]", summary)
+        self.assertNotIn("Range(", summary)
+
+    def test_pickle(self):
+        values = {
+            "a": {
+                "array": [1.0, 2.0]
+            },
+            "b": {
+                "array": [4.0, 5.0, 6.0]
+            },
+            "c": 7.0,
+            "badger": "creature"
+        }
+
+        s = MainSettings(values)
+        for space in (Space(s), Space(s, lazy=True, cache=2)):
+            copy = pickle.loads(pickle.dumps(space))
+            self.assertEqual(copy.lazy, space.lazy)
+            self.assertEqual(copy.space, space.space)
+            self.assertEqual(copy[1, 2], space[1, 2])
+            self.assertEqual(copy[0, 0].b, 4.0)
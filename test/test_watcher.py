@@ -0,0 +1,154 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from json_settings import DictionarySetting
+from json_settings import ListSetting
+from json_settings import Settings
+from json_settings import SettingsWatcher
+from json_settings import SettingErrorMessage
+
+
+class Leaf(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.item = int
+
+
+class LeafList(ListSetting):
+    @ListSetting.assign
+    def __init__(self, values):
+        self.type = Leaf
+
+
+class LeafDictionary(DictionarySetting):
+    @DictionarySetting.assign
+    def __init__(self, values):
+        self.type = Leaf
+
+
+class Root(Settings):
+    @Settings.assign
+    def __init__(self, values):
+        self.first = Leaf
+        self.second = Leaf
+        self.items = LeafList
+        self.name = str
+
+
+class TestSettingsWatcher(unittest.TestCase):
+    """The unit tests for the :class:`~.SettingsWatcher` class.
+
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "settings.json")
+        self.values = {"first": {"item": 1},
+                       "second": {"item": 2},
+                       "items": [{"item": 3}, {"item": 4}],
+                       "name": "a"}
+        self.mtime = 0
+        self.write(self.values)
+        self.published = list()
+        self.watcher = SettingsWatcher(self.path, Root, self.published.append)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, values):
+        temporary = self.path + ".tmp"
+        with open(temporary, 'w') as f:
+            json.dump(values, f)
+        self.mtime += 10**9
+        os.utime(temporary, ns=(self.mtime, self.mtime))
+        os.replace(temporary, self.path)
+
+    def test_poll(self):
+        self.assertTrue(self.watcher.poll())
+        self.assertFalse(self.watcher.poll())
+        old = self.watcher.setting
+        self.values["second"]["item"] = 5
+        self.values["items"][1]["item"] = 6
+        self.write(self.values)
+        self.assertTrue(self.watcher.poll())
+        new = self.watcher.setting
+        self.assertEqual(self.published, [old, new])
+        self.assertEqual(new.second.item, 5)
+        self.assertEqual(new.items[1].item, 6)
+        self.assertIs(new.first, old.first)
+        self.assertIs(new.items[0], old.items[0])
+        self.assertEqual(old.second.item, 2)
+        self.assertEqual(new, Root(self.values))
+
+    def test_invalid_change(self):
+        self.watcher.poll()
+        old = self.watcher.setting
+        self.values["first"]["item"] = "1"
+        self.write(self.values)
+        with self.assertRaises(SettingErrorMessage) as context:
+            self.watcher.poll()
+        self.assertEqual(context.exception.route, ["first", "item"])
+        self.assertIs(self.watcher.setting, old)
+        del self.values["first"]
+        self.write(self.values)
+        with self.assertRaises(SettingErrorMessage):
+            self.watcher.poll()
+        self.assertIs(self.watcher.setting, old)
+
+    def test_retry_failed_reload(self):
+        self.watcher.poll()
+        with open(self.path, 'w') as f:
+            f.write('{"first": ')
+        os.utime(self.path, ns=(self.mtime + 1, self.mtime + 1))
+        for _ in range(2):
+            with self.assertRaises(json.JSONDecodeError):
+                self.watcher.poll()
+        self.values["name"] = "b"
+        self.write(self.values)
+        self.assertTrue(self.watcher.poll())
+        self.assertEqual(self.watcher.setting.name, "b")
+
+    def test_structure_change(self):
+        self.watcher.poll()
+        old = self.watcher.setting
+        self.values["items"].append({"item": 7})
+        self.write(self.values)
+        self.watcher.poll()
+        self.assertEqual(len(self.watcher.setting.items), 3)
+        self.assertIs(self.watcher.setting.first, old.first)
+
+    def test_thread(self):
+        errors = list()
+        self.watcher.error_callback = errors.append
+        self.watcher.interval = 0.01
+        with self.watcher:
+            self.values["name"] = "b"
+            self.write(self.values)
+            for _ in range(500):
+                if self.published and self.published[-1].name == "b":
+                    break
+                time.sleep(0.01)
+        self.assertEqual(self.published[-1].name, "b")
+        self.assertIsNone(self.watcher.thread)
+        self.assertEqual(errors, [])
+
+    def test_list_and_dictionary_roots(self):
+        for setting_type, values, changed, unchanged in [
+                (LeafList, [{"item": 1}, {"item": 2}], 0, 1),
+                (LeafDictionary, {"a": {"item": 1}, "b": {"item": 2}},
+                 "a", "b")]:
+            published = list()
+            watcher = SettingsWatcher(self.path, setting_type,
+                                      published.append)
+            self.write(values)
+            self.assertTrue(watcher.poll())
+            for item in range(3, 6):
+                values[changed]["item"] = item
+                self.write(values)
+                self.assertTrue(watcher.poll())
+                self.assertEqual(watcher.setting[changed].item, item)
+            self.assertEqual(len(published), 4)
+            self.assertIs(published[-1][unchanged], published[0][unchanged])